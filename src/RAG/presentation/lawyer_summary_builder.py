@@ -1,3 +1,5 @@
+from collections import Counter
+from operator import attrgetter
 from typing import List, Any
 
 from RAG.contract_analysis import ContractAnalysisResult
@@ -167,6 +169,7 @@ def build_lawyer_friendly_summary(
     # -------------------------------------------------
     # Key risk statistics (lawyer-readable)
     # -------------------------------------------------
+    risk_level_counts = Counter(map(attrgetter("risk_level"), enforceable_clauses))
     stats = [
         f"Total clauses reviewed: {len(analysis.clauses)}",
         f"Enforceable clauses assessed: {total_enforceable}",
@@ -177,8 +180,7 @@ def build_lawyer_friendly_summary(
             f"{dist.insufficient_evidence}/{total_enforceable} "
             f"({round(insufficient_ratio, 2)})"
         ),
-        f"High-risk enforceable clauses: "
-        f"{sum(1 for c in enforceable_clauses if getattr(c, 'risk_level', None) == 'high')}",
+        f"High-risk enforceable clauses: {risk_level_counts['high']}",
     ]
 
     # -------------------------------------------------
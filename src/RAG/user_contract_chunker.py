@@ -2,6 +2,7 @@ import re
 from dataclasses import dataclass, field
 from typing import List, Optional
 from enum import Enum
+from operator import methodcaller
 
 
 class ChunkType(Enum):
@@ -246,7 +247,7 @@ class UserContractChunker:
         if len(matches) < 3:
             return self._fallback_split(text)
 
-        matches = sorted(matches, key=lambda m: m.start())
+        matches = sorted(matches, key=methodcaller("start"))
         return self._split_by_matches(text, matches)
 
     # Sub-clause merge: (i)(ii)(iii) with short text -> one chunk for better RERA relevance
@@ -3,6 +3,7 @@ from pathlib import Path
 from RAG.models import ClauseUnderstandingResult
 from RAG.user_contract_chunker import ContractChunk
 from agents.intent_rules_engine import IntentRuleEngine
+from utils.scoring import clip01
 
 
 class ClauseUnderstandingAgent:
@@ -143,8 +144,7 @@ class ClauseUnderstandingAgent:
         # ---------------------------------------------
         # Clamp
         # ---------------------------------------------
-        score = max(0.0, min(1.0, score))
-        return round(score, 2)
+        return round(clip01(score), 2)
 
     def _derive_clause_role(self, intent: str, obligation_type: str) -> str:
         """
@@ -177,4 +177,4 @@ class ClauseUnderstandingAgent:
         if clause.confidence >= 0.8:
             score += 0.1
 
-        return round(max(0.0, min(1.0, score)), 2)
+        return round(clip01(score), 2)
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
-from typing import List, Optional
-from constants.alignment import ALLOWED_ALIGNMENTS
-
+import heapq
+from operator import attrgetter
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from constants.alignment import (
+    ALIGNED,
+    PARTIALLY_ALIGNED,
+    INSUFFICIENT_EVIDENCE,
+    CONTRADICTION,
+    CONFLICTING,
+)
 from RAG.contract_analysis import (
     ContractAnalysisResult,
     ContractSummary,
@@ -13,12 +23,187 @@ from RAG.contract_analysis import (
 
 from configs.callibration.callibration_config_loader import CalibrationConfig
 
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
 
-RISK_RELEVANT_ROLES = {
+RISK_RELEVANT_ROLES = frozenset({
     "obligation",
     "right",
     "procedure",
-}
+})
+
+_HIGH_RISK = "high"
+
+_ALIGNMENT_OF = attrgetter("alignment")
+_QUALITY_KEY = attrgetter("quality_score")
+
+# Integer codes for alignments; index order matches ContractRiskDistribution.
+ALIGNMENT_ORDER = (
+    ALIGNED,
+    PARTIALLY_ALIGNED,
+    INSUFFICIENT_EVIDENCE,
+    CONTRADICTION,
+)
+
+# "conflicting" gets its own trailing code: it counts towards the number
+# of enforceable clauses but, unlike "contradiction", not towards the
+# distribution, the contradiction cap or the automatic key issues.
+_ALIGNMENT_CODES = {a: i for i, a in enumerate(ALIGNMENT_ORDER)}
+_ALIGNMENT_CODES[CONFLICTING] = len(ALIGNMENT_ORDER)
+_N_CODES = len(_ALIGNMENT_CODES)
+
+_ALIGNED = _ALIGNMENT_CODES[ALIGNED]
+_PARTIAL = _ALIGNMENT_CODES[PARTIALLY_ALIGNED]
+_INSUFFICIENT = _ALIGNMENT_CODES[INSUFFICIENT_EVIDENCE]
+_CONTRADICTION = _ALIGNMENT_CODES[CONTRADICTION]
+_CONFLICTING = _ALIGNMENT_CODES[CONFLICTING]
+
+# Enforceable clauses scoring below this are surfaced as key issues.
+ISSUE_QUALITY_THRESHOLD = 0.5
+
+# Groundedness assumed for clauses without a retrieval quality signal.
+DEFAULT_GROUNDING = 0.7
+
+# Contracts without enforceable clauses keep every factor at its default:
+# legal_core = clarity = 1.0, grounding = DEFAULT_GROUNDING.
+_NEUTRAL_SCORE = round(0.5 * 1.0 + 0.3 * 1.0 + 0.2 * DEFAULT_GROUNDING, 2)
+_NEUTRAL_CONFIDENCE = round(0.6 * DEFAULT_GROUNDING + 0.4 * 1.0, 2)
+_EMPTY_COUNTS = (0,) * _N_CODES
+
+# Number of key issues surfaced to the UI / lawyer summary.
+TOP_ISSUES_LIMIT = 10
+
+# Contract summary wording; filled by _summary_text().
+_SUMMARY_TEMPLATE = (
+    "The agreement was reviewed across {raw_total} clauses. "
+    "{risk_total} clauses materially affect legal rights. "
+    "{contradiction_count} enforceable clauses present statutory conflicts. "
+    "The overall legal risk score of {score} reflects legal exposure, "
+    "drafting clarity, and statutory grounding."
+)
+
+# Default issue wording, indexed by alignment code.
+_ISSUE_REASON_BY_CODE = (
+    "Clause requires clarification to avoid legal ambiguity",   # aligned
+    "Clause requires clarification to avoid legal ambiguity",   # partially_aligned
+    "Clause lacks clear statutory support or explicit rights",  # insufficient_evidence
+    "Clause conflicts with statutory RERA protections",         # contradiction
+    "Clause requires clarification to avoid legal ambiguity",   # conflicting
+)
+
+
+# =========================================================
+# Scoring kernel
+# =========================================================
+
+def _score_kernel_loop(codes, risk_mask, high_risk, quality, grounding, issue_threshold):
+    """
+    Single pass over the clause arrays (compiled with Numba when available).
+
+    Returns (risk_counts, high_risk_count, grounding_sum, issue_idx) over
+    enforceable clauses, where issue_idx holds the positions of clauses that
+    are contradictory, unsupported or below the quality threshold, in
+    contract order.
+    """
+    n = codes.shape[0]
+    risk_counts = np.zeros(_N_CODES, dtype=np.int32)
+    issue_idx = np.empty(n, dtype=np.int32)
+    n_issues = 0
+    n_high = 0
+    grounding_sum = 0.0
+
+    for i in range(n):
+        a = codes[i]
+        if risk_mask[i]:
+            risk_counts[a] += 1
+            grounding_sum += grounding[i]
+            if high_risk[i]:
+                n_high += 1
+            if (
+                a == _CONTRADICTION
+                or a == _INSUFFICIENT
+                or quality[i] < issue_threshold
+            ):
+                issue_idx[n_issues] = i
+                n_issues += 1
+
+    return risk_counts, n_high, grounding_sum, issue_idx[:n_issues]
+
+
+def _score_kernel_numpy(codes, risk_mask, high_risk, quality, grounding, issue_threshold):
+    """
+    Vectorized equivalent of _score_kernel_loop for installs without Numba.
+    """
+    is_problem = (
+        (codes == _CONTRADICTION)
+        | (codes == _INSUFFICIENT)
+        | (quality < issue_threshold)
+    )
+    return (
+        np.bincount(codes[risk_mask], minlength=_N_CODES),
+        int(np.count_nonzero(high_risk & risk_mask)),
+        sum(grounding[risk_mask].tolist()),
+        np.flatnonzero(risk_mask & is_problem),
+    )
+
+
+_score_kernel = (
+    njit(cache=True)(_score_kernel_loop)
+    if _NUMBA_AVAILABLE
+    else _score_kernel_numpy
+)
+
+
+# =========================================================
+# Clause arrays
+# =========================================================
+
+def _validate_alignments(clauses: List[ClauseAnalysisResult]) -> None:
+    """
+    Reject unknown alignments with one set difference; the clause list is
+    only rescanned to name the offending clause.
+    """
+    unknown = set(map(_ALIGNMENT_OF, clauses)).difference(_ALIGNMENT_CODES)
+    if unknown:
+        for c in clauses:
+            if c.alignment in unknown:
+                raise ValueError(
+                    f"Invalid alignment '{c.alignment}' for clause {c.clause_id}"
+                )
+
+
+def _clause_arrays(clauses: List[ClauseAnalysisResult]):
+    """
+    Classify clauses into the column arrays consumed by the scoring kernel:
+    (codes, risk_mask, high_risk, quality, grounding).
+    """
+    n = len(clauses)
+    return (
+        np.fromiter(
+            (_ALIGNMENT_CODES[c.alignment] for c in clauses), dtype=np.int8, count=n
+        ),
+        np.fromiter(
+            (c.clause_role in RISK_RELEVANT_ROLES for c in clauses), dtype=np.bool_, count=n
+        ),
+        np.fromiter(
+            (c.risk_level == _HIGH_RISK for c in clauses), dtype=np.bool_, count=n
+        ),
+        np.fromiter(
+            (c.quality_score for c in clauses), dtype=np.float64, count=n
+        ),
+        np.fromiter(
+            (
+                DEFAULT_GROUNDING if c.groundedness_score is None else c.groundedness_score
+                for c in clauses
+            ),
+            dtype=np.float64,
+            count=n,
+        ),
+    )
 
 
 class ContractAggregationAgent:
@@ -26,6 +211,12 @@ class ContractAggregationAgent:
     def __init__(self, calibration: CalibrationConfig):
         self.calibration = calibration
 
+        # Calibration is immutable after load; resolve the thresholds used
+        # on every aggregation once instead of re-probing the dict per call.
+        thresholds = calibration.thresholds
+        self._contradiction_fatal = thresholds.get("contradiction_fatal", True)
+        self._insufficient_threshold = thresholds.get("insufficient_evidence_ratio", 0.30)
+
     # =========================================================
     # PUBLIC API
     # =========================================================
@@ -38,59 +229,136 @@ class ContractAggregationAgent:
         if not clauses:
             raise ValueError("Cannot aggregate empty clause list")
 
-        raw_dist = {
-            "aligned": 0,
-            "partially_aligned": 0,
-            "insufficient_evidence": 0,
-            "contradiction": 0
-        }
-
-        risk_clauses: List[ClauseAnalysisResult] = []
-        issues: List[KeyIssue] = []
+        _validate_alignments(clauses)
 
         # -------------------------------------------------
-        # Classify clauses
+        # Distribution, factor accumulators and issue selection
+        # (single fused kernel pass)
         # -------------------------------------------------
-        for c in clauses:
-            alignment = c.alignment
-            if alignment == "conflicting":
-                alignment = "contradiction"
+        codes, risk_mask, high_risk, quality, grounding_values = _clause_arrays(clauses)
+        risk_counts, high_risk_count, grounding_sum, issue_idx = _score_kernel(
+            codes,
+            risk_mask,
+            high_risk,
+            quality,
+            grounding_values,
+            ISSUE_QUALITY_THRESHOLD,
+        )
 
-            if alignment not in ALLOWED_ALIGNMENTS:
-                raise ValueError(
-                    f"Invalid alignment '{alignment}' for clause {c.clause_id}"
-                )
+        return self._build_result(
+            clauses,
+            risk_counts.tolist(),
+            int(high_risk_count),
+            float(grounding_sum),
+            issue_idx.tolist(),
+        )
 
-            raw_dist[alignment] += 1
+    def aggregate_many(
+        self,
+        contracts: List[List[ClauseAnalysisResult]],
+    ) -> List[ContractAnalysisResult]:
+        """
+        Aggregate several contracts with one vectorized pass.
+
+        All clauses are concatenated and reduced per contract segment, so
+        NumPy dispatch is paid once per batch rather than once per contract.
+        Results match calling aggregate() on each contract in turn.
+        """
+        if not contracts:
+            return []
 
-            if getattr(c, "clause_role", None) in RISK_RELEVANT_ROLES:
-                risk_clauses.append(c)
+        for clauses in contracts:
+            if not clauses:
+                raise ValueError("Cannot aggregate empty clause list")
+            _validate_alignments(clauses)
 
-        total_risk = len(risk_clauses) or 1
+        lengths = [len(clauses) for clauses in contracts]
+        starts = np.cumsum([0] + lengths)
+        n_contracts = len(contracts)
+        n_codes = _N_CODES
 
-        risk_dist = {
-            "aligned": sum(1 for c in risk_clauses if c.alignment == "aligned"),
-            "partially_aligned": sum(1 for c in risk_clauses if c.alignment == "partially_aligned"),
-            "insufficient_evidence": sum(1 for c in risk_clauses if c.alignment == "insufficient_evidence"),
-            "contradiction": sum(1 for c in risk_clauses if c.alignment == "contradiction"),
-        }
+        codes, risk_mask, high_risk, quality, grounding_values = _clause_arrays(
+            [c for clauses in contracts for c in clauses]
+        )
+        segment = np.repeat(np.arange(n_contracts), lengths)
+        risk_segment = segment[risk_mask]
+
+        risk_counts = np.bincount(
+            risk_segment * n_codes + codes[risk_mask],
+            minlength=n_contracts * n_codes,
+        ).reshape(n_contracts, n_codes)
+        high_risk_counts = np.bincount(
+            segment[risk_mask & high_risk], minlength=n_contracts
+        )
+        grounding_sums = np.bincount(
+            risk_segment, weights=grounding_values[risk_mask], minlength=n_contracts
+        )
 
-        insufficient_ratio = risk_dist["insufficient_evidence"] / total_risk
-        partially_ratio = risk_dist["partially_aligned"] / total_risk
+        is_problem = (
+            (codes == _CONTRADICTION)
+            | (codes == _INSUFFICIENT)
+            | (quality < ISSUE_QUALITY_THRESHOLD)
+        )
+        issue_pos = np.flatnonzero(risk_mask & is_problem)
+        issue_bounds = np.searchsorted(issue_pos, starts).tolist()
+
+        return [
+            self._build_result(
+                clauses,
+                risk_counts[k].tolist(),
+                int(high_risk_counts[k]),
+                float(grounding_sums[k]),
+                (issue_pos[issue_bounds[k]:issue_bounds[k + 1]] - starts[k]).tolist(),
+            )
+            for k, clauses in enumerate(contracts)
+        ]
+
+    def _build_result(
+        self,
+        clauses: List[ClauseAnalysisResult],
+        risk_counts: List[int],
+        high_risk_count: int,
+        grounding_sum: float,
+        issue_idx: List[int],
+    ) -> ContractAnalysisResult:
+        """
+        Turn the per-contract accumulators into the contract summary.
+        """
+        # risk_counts is indexed by alignment code.
+        risk_n = sum(risk_counts)
+        if not risk_n:
+            return self._neutral_result(clauses)
+
+        contradiction_count = risk_counts[_CONTRADICTION]
+        insufficient_ratio = risk_counts[_INSUFFICIENT] / risk_n
+        partially_ratio = risk_counts[_PARTIAL] / risk_n
 
         # -------------------------------------------------
         # Top issues (lawyer-facing)
         # IMPORTANT: This does NOT change score/confidence.
         # -------------------------------------------------
-        issues = self._build_top_issues(risk_clauses)
+        issues = self._build_top_issues(
+            [clauses[i] for i in issue_idx]
+        )
 
         # =========================================================
         # NEW CLEAN 3-FACTOR CONTRACT SCORE
         # =========================================================
 
-        legal_core = self._legal_core_score(risk_clauses)
-        clarity = self._clarity_score(risk_dist, total_risk)
-        grounding = self._avg_grounding(risk_clauses)
+        # Legal core: statutory conflicts and high-risk drafting
+        legal_core = (
+            1.0
+            - 0.6 * (contradiction_count / risk_n)
+            - 0.3 * (high_risk_count / risk_n)
+        )
+        legal_core = 0.0 if legal_core < 0.0 else legal_core
+
+        # Clarity: unsupported or only partially aligned clauses
+        clarity = 1.0 - 0.5 * insufficient_ratio - 0.3 * partially_ratio
+        clarity = 0.0 if clarity < 0.0 else clarity
+
+        # Grounding: mean retrieval groundedness of enforceable clauses
+        grounding = grounding_sum / risk_n
 
         contract_score = round(
             0.5 * legal_core +
@@ -107,12 +375,9 @@ class ContractAggregationAgent:
         #
         # This prevents unstable summaries like:
         #   score=0.85 (safe) AND insufficient_ratio≈0.63 (review_required)
-        contradiction_fatal = self.calibration.thresholds.get("contradiction_fatal", True)
-        insufficient_threshold = self.calibration.thresholds.get("insufficient_evidence_ratio", 0.30)
-
-        if contradiction_fatal and risk_dist["contradiction"] > 0:
+        if self._contradiction_fatal and contradiction_count > 0:
             contract_score = min(contract_score, 0.39)
-        elif insufficient_ratio > insufficient_threshold:
+        elif insufficient_ratio > self._insufficient_threshold:
             # cap below the "low risk" band
             contract_score = min(contract_score, 0.64)
 
@@ -126,56 +391,53 @@ class ContractAggregationAgent:
             overall_score=contract_score,
             risk_level=self._risk_grade(contract_score),
             legal_confidence=legal_confidence,
-            summary=self._summary_text(risk_dist, raw_dist, contract_score),
-            distribution=ContractRiskDistribution(**risk_dist)
+            summary=self._summary_text(
+                contradiction_count,
+                contract_score,
+                raw_total=len(clauses),
+                risk_total=risk_n - risk_counts[_CONFLICTING],
+            ),
+            distribution=self._distribution(risk_counts)
         )
 
         return ContractAnalysisResult(
             contract_summary=summary,
-            top_issues=issues[:10],
+            top_issues=issues,
             clauses=clauses
         )
 
-    # =========================================================
-    # SCORING COMPONENTS
-    # =========================================================
-
-    def _legal_core_score(self, clauses):
-        if not clauses:
-            return 1.0
-
-        contradiction_ratio = sum(
-            1 for c in clauses if c.alignment == "contradiction"
-        ) / len(clauses)
-
-        high_risk_ratio = sum(
-            1 for c in clauses if c.risk_level == "high"
-        ) / len(clauses)
-
-        score = 1.0
-        score -= 0.6 * contradiction_ratio
-        score -= 0.3 * high_risk_ratio
-
-        return max(0.0, score)
+    def _neutral_result(
+        self,
+        clauses: List[ClauseAnalysisResult],
+    ) -> ContractAnalysisResult:
+        """
+        Short-circuit for contracts with no enforceable clauses.
 
-    def _clarity_score(self, dist, total):
-        insufficient_ratio = dist["insufficient_evidence"] / total
-        partial_ratio = dist["partially_aligned"] / total
+        No factor can move away from its default, so the summary is built
+        from precomputed constants and there are no key issues.
+        """
+        summary = ContractSummary(
+            overall_score=_NEUTRAL_SCORE,
+            risk_level=self._risk_grade(_NEUTRAL_SCORE),
+            legal_confidence=_NEUTRAL_CONFIDENCE,
+            summary=self._summary_text(
+                0,
+                _NEUTRAL_SCORE,
+                raw_total=len(clauses),
+                risk_total=0,
+            ),
+            distribution=self._distribution(_EMPTY_COUNTS)
+        )
 
-        return max(0.0, 1.0 - 0.5 * insufficient_ratio - 0.3 * partial_ratio)
+        return ContractAnalysisResult(
+            contract_summary=summary,
+            top_issues=[],
+            clauses=clauses
+        )
 
-    def _avg_grounding(self, clauses):
-        if not clauses:
-            return 0.7
-        scores = [
-            (
-                float(getattr(c, "groundedness_score"))
-                if getattr(c, "groundedness_score", None) is not None
-                else 0.7
-            )
-            for c in clauses
-        ]
-        return sum(scores) / len(scores)
+    # =========================================================
+    # SCORING COMPONENTS
+    # =========================================================
 
     def _risk_grade(self, score: float) -> str:
         if score >= 0.75:
@@ -184,18 +446,33 @@ class ContractAggregationAgent:
             return "medium"
         return "high"
 
+    def _distribution(self, counts) -> ContractRiskDistribution:
+        # Counts are plain ints produced by the kernel; skip re-validation.
+        return ContractRiskDistribution.model_construct(
+            aligned=counts[_ALIGNED],
+            partially_aligned=counts[_PARTIAL],
+            insufficient_evidence=counts[_INSUFFICIENT],
+            contradiction=counts[_CONTRADICTION],
+        )
+
     # =========================================================
     # SUMMARY TEXT
     # =========================================================
 
-    def _summary_text(self, risk_dist: dict, raw_dist: dict, score: float) -> str:
-        return (
-            f"The agreement was reviewed across {sum(raw_dist.values())} clauses. "
-            f"{sum(risk_dist.values())} clauses materially affect legal rights. "
-            f"{risk_dist['contradiction']} enforceable clauses present statutory conflicts. "
-            f"The overall legal risk score of {score} reflects legal exposure, "
-            f"drafting clarity, and statutory grounding."
-        )
+    def _summary_text(
+        self,
+        contradiction_count: int,
+        score: float,
+        *,
+        raw_total: int,
+        risk_total: int,
+    ) -> str:
+        return _SUMMARY_TEMPLATE.format_map({
+            "raw_total": raw_total,
+            "risk_total": risk_total,
+            "contradiction_count": contradiction_count,
+            "score": score,
+        })
 
     # =========================================================
     # Issues extraction (used by UI + lawyer summary)
@@ -203,35 +480,36 @@ class ContractAggregationAgent:
 
     def _build_top_issues(self, clauses: List[ClauseAnalysisResult]) -> List[KeyIssue]:
         """
-        Build KeyIssue list from clause outputs.
+        Build the worst-first KeyIssue list from enforceable clauses already
+        flagged as weak/unclear by the scoring kernel.
+
+        Clauses are ranked on their raw quality score; rounding happens only
+        for the issues actually emitted.
 
         This is intentionally conservative and does not affect scoring.
         """
         out: List[KeyIssue] = []
 
-        for c in clauses:
-            # focus on enforceable clauses that are weak/unclear
-            is_problem = (
-                c.alignment in {"contradiction", "insufficient_evidence"}
-                or float(c.quality_score) < 0.5
-            )
-            if not is_problem:
-                continue
+        # Bound methods hoisted out of the per-issue loop.
+        append = out.append
+        citation_refs = self._citation_refs
+        default_issue_reason = self._default_issue_reason
 
-            statutory_anchor = self._statutory_anchor(c)
-            evidence_reference = self._evidence_reference(c)
-            evidence_snippet = (c.evidence_snippets[0] if getattr(c, "evidence_snippets", None) else None)
+        worst = heapq.nsmallest(TOP_ISSUES_LIMIT, clauses, key=_QUALITY_KEY)
+        for c in worst:
+            statutory_anchor, evidence_reference = citation_refs(c)
+            evidence_snippet = c.evidence_snippets[0] if c.evidence_snippets else None
 
             issue_text = (
                 c.issue_reason
-                or self._default_issue_reason(
-                    alignment=c.alignment,
+                or default_issue_reason(
+                    alignment_code=_ALIGNMENT_CODES[c.alignment],
                     statutory_anchor=statutory_anchor,
                     evidence_reference=evidence_reference,
                 )
             )
 
-            out.append(
+            append(
                 KeyIssue(
                     clause_id=c.clause_id,
                     display_reference=c.normalized_reference or f"Clause {c.clause_id}",
@@ -242,67 +520,64 @@ class ContractAggregationAgent:
                     evidence_reference=evidence_reference,
                     evidence_snippet=evidence_snippet,
                     recommended_action=c.recommended_action or "Independent legal review is advised",
-                    quality_score=float(round(c.quality_score, 2)),
+                    quality_score=round(c.quality_score, 2),
                 )
             )
 
-        # sort worst first
-        out.sort(key=lambda x: x.quality_score)
         return out
 
-    def _statutory_anchor(self, clause: ClauseAnalysisResult) -> Optional[str]:
-        refs = getattr(clause, "statutory_refs", None) or []
-        if refs:
-            return refs[0]
-        # fall back to citations (prefer statute-like sources)
-        for cit in getattr(clause, "citations", []) or []:
-            source = str(cit.get("source", ""))
-            ref = str(cit.get("ref", ""))
-            if "rera" in source.lower():
-                return f"{source} - {ref}" if ref else source
-        return None
-
-    def _evidence_reference(self, clause: ClauseAnalysisResult) -> Optional[str]:
+    def _citation_refs(
+        self, clause: ClauseAnalysisResult
+    ) -> Tuple[Optional[str], Optional[str]]:
         """
-        Prefer statutory evidence references when available.
+        Resolve (statutory_anchor, evidence_reference) in one citation pass.
+
+        statutory_anchor:
+        - First statutory_refs entry, else the first RERA citation.
 
-        Why:
-        - Makes lawyer summaries feel grounded in the Act/Rules, not just model templates.
+        evidence_reference:
+        - Prefer statutory evidence references when available, so lawyer
+          summaries feel grounded in the Act/Rules, not just model templates.
         - Does not affect scoring; presentation/issue text only.
         """
-        statutory: List[str] = []
-        non_statutory: List[str] = []
-
-        for cit in getattr(clause, "citations", []) or []:
-            source = str(cit.get("source", "")).strip()
-            ref = str(cit.get("ref", "")).strip()
-            if not source or not ref:
-                continue
-            item = f"{source} - {ref}"
-            if "rera" in source.lower():
-                statutory.append(item)
-            else:
-                non_statutory.append(item)
-
-        if statutory:
-            return statutory[0]
-        if non_statutory:
-            return non_statutory[0]
-        return None
+        refs = clause.statutory_refs
+        anchor = refs[0] if refs else None
+        anchor_pending = not refs
+        statutory_ref: Optional[str] = None
+        other_ref: Optional[str] = None
+
+        for cit in clause.citations:
+            raw_source = str(cit.get("source", ""))
+            raw_ref = str(cit.get("ref", ""))
+            is_statutory = "rera" in raw_source.lower()
+
+            if anchor_pending and is_statutory:
+                # fall back to citations (prefer statute-like sources)
+                anchor = f"{raw_source} - {raw_ref}" if raw_ref else raw_source
+                anchor_pending = False
+
+            source = raw_source.strip()
+            ref = raw_ref.strip()
+            if source and ref:
+                if is_statutory:
+                    if statutory_ref is None:
+                        statutory_ref = f"{source} - {ref}"
+                elif other_ref is None:
+                    other_ref = f"{source} - {ref}"
+
+            if statutory_ref is not None and not anchor_pending:
+                break
+
+        return anchor, statutory_ref or other_ref
 
     def _default_issue_reason(
         self,
         *,
-        alignment: str,
+        alignment_code: int,
         statutory_anchor: Optional[str],
         evidence_reference: Optional[str],
     ) -> str:
-        if alignment == "contradiction":
-            base = "Clause conflicts with statutory RERA protections"
-        elif alignment == "insufficient_evidence":
-            base = "Clause lacks clear statutory support or explicit rights"
-        else:
-            base = "Clause requires clarification to avoid legal ambiguity"
+        base = _ISSUE_REASON_BY_CODE[alignment_code]
 
         details: List[str] = []
         if statutory_anchor:
@@ -1,6 +1,13 @@
+import hashlib
+import json
+import os
+import re
+import sys
+import weakref
+from functools import lru_cache
 import yaml
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from RAG.models import ClauseUnderstandingResult
 from utils.schema_factory import build_model
@@ -11,6 +18,189 @@ from utils.statute_normalizer import (
 )
 from configs.schema_config import STRICT_SCHEMA
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import ahocorasick
+    _AHOCORASICK_AVAILABLE = True
+except ImportError:
+    _AHOCORASICK_AVAILABLE = False
+
+
+_RISK_LEVELS = ("high", "medium", "low")
+
+_RESULT_FIELDS = frozenset(ClauseUnderstandingResult.model_fields)
+
+# Distinct (clause text, state) pairs remembered by IntentRuleEngine.
+ANALYZE_CACHE_SIZE = 4096
+
+
+def _weak_lru_cache(method, maxsize: int):
+    """
+    lru_cache over a bound method that holds its instance weakly.
+
+    Caching the bound method itself would make the instance reference
+    itself through the cache, so it could only be freed by the cyclic GC.
+    """
+    instance_ref = weakref.ref(method.__self__)
+    func = method.__func__
+
+    @lru_cache(maxsize=maxsize)
+    def cached(*args):
+        return func(instance_ref(), *args)
+
+    return cached
+
+
+# =========================================================
+# Rules loading
+# =========================================================
+
+def _rules_cache_path(rules_path: Path) -> Path:
+    """
+    Location of the parsed-rules sidecar for rules_path.
+
+    Sidecars live under $XDG_CACHE_HOME (default ~/.cache), never next to
+    the YAML, so read-only installs and source checkouts stay untouched.
+    The resolved YAML path is hashed into the name to keep rule files
+    with the same stem apart.
+    """
+    cache_root = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    digest = hashlib.sha1(str(rules_path.resolve()).encode("utf-8")).hexdigest()
+    cache_name = f"{rules_path.stem}-{digest[:16]}.rules.json"
+    return Path(cache_root) / "contract-risk-agent" / cache_name
+
+
+def _load_rules(rules_path: Path) -> Any:
+    """
+    Load the intent rules YAML through a JSON sidecar.
+
+    The sidecar (see _rules_cache_path) stores the parsed rules together
+    with the YAML's mtime and size; it is reused only while both still
+    match, so edits to the YAML are picked up on the next construction.
+    JSON keeps the sidecar as inert data (like safe_load), and is only
+    written when the rules round-trip through it unchanged. The write is
+    skipped quietly when the cache directory is not writable.
+    """
+    stat = rules_path.stat()
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    cache_path = _rules_cache_path(rules_path)
+
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("stamp") == stamp:
+            return cached["rules"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+
+    with open(rules_path, "r") as f:
+        rules = yaml.load(f, Loader=_YamlLoader)
+
+    try:
+        payload = json.dumps({"stamp": stamp, "rules": rules})
+    except (TypeError, ValueError):
+        return rules
+    if json.loads(payload)["rules"] != rules:
+        return rules
+
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+    return rules
+
+
+def _compile_keywords(keywords: List[str]) -> Optional[re.Pattern]:
+    """
+    Compile literal keywords into a single alternation matched against
+    casefolded clause text. Returns None when there are no keywords.
+    """
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(kw.casefold()) for kw in keywords))
+
+
+def _build_automaton(keyword_lists: List[List[str]]):
+    """
+    Build one Aho-Corasick automaton over prioritized keyword lists.
+
+    Each keyword maps to the rank of the first list containing it, so a
+    single pass over the text can recover the highest-priority match.
+    Returns None when pyahocorasick is missing or there are no keywords.
+    """
+    if not _AHOCORASICK_AVAILABLE:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for rank, keywords in enumerate(keyword_lists):
+        for kw in keywords:
+            kw = kw.casefold()
+            if kw not in automaton:
+                automaton.add_word(kw, rank)
+
+    if not len(automaton):
+        return None
+    automaton.make_automaton()
+    return automaton
+
+
+# Hit categories carried by the single-pass scan automaton.
+_HIT_VIOLATION = 0
+_HIT_BASE = 1
+_HIT_IMPLICIT = 2
+_HIT_RISK = 3
+
+
+def _build_tagged_automaton(entries: List[Tuple[str, Tuple[int, int, int]]]):
+    """
+    Build one Aho-Corasick automaton whose values are the tuples of
+    (category, slot, rank) tags attached to each keyword, so several rule
+    classes can be matched in a single pass. Returns None when
+    pyahocorasick is missing or there are no keywords.
+    """
+    if not _AHOCORASICK_AVAILABLE:
+        return None
+
+    tags_by_kw: Dict[str, List[Tuple[int, int, int]]] = {}
+    for kw, tag in entries:
+        tags = tags_by_kw.setdefault(kw.casefold(), [])
+        if tag not in tags:
+            tags.append(tag)
+
+    if not tags_by_kw:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for kw, tags in tags_by_kw.items():
+        automaton.add_word(kw, tuple(tags))
+    automaton.make_automaton()
+    return automaton
+
+
+def _first_match_rank(automaton, text: str) -> Optional[int]:
+    """
+    Lowest rank among all keyword hits in text, or None if nothing matches.
+    """
+    best = None
+    for _, rank in automaton.iter(text):
+        if best is None or rank < best:
+            best = rank
+            if rank == 0:
+                break
+    return best
+
 
 class IntentRuleEngine:
     """
@@ -32,25 +222,112 @@ class IntentRuleEngine:
         if not rules_path.exists():
             raise FileNotFoundError(f"Intent rules file not found: {rules_path}")
 
-        with open(rules_path, "r") as f:
-            self.rules = yaml.safe_load(f)
+        self.rules = _load_rules(rules_path)
 
         if not self.rules:
             raise ValueError("Intent rules YAML is empty or invalid")
 
-        self.base_intents = self.rules.get("intents", {})
+        # Intent and state keys are interned so the (intent_key, state)
+        # cache lookups below compare by identity.
+        self.base_intents = {
+            sys.intern(k): v for k, v in self.rules.get("intents", {}).items()
+        }
         self.violation_intents = self.rules.get("violation_only_intents", {})
-        self.state_overrides = self.rules.get("state_overrides", {})
+        self.state_overrides = {
+            sys.intern(k): v for k, v in self.rules.get("state_overrides", {}).items()
+        }
         self.global_cfg = self.rules.get("global", {})
 
         self.implicit_markers = [
-            m.lower() for m in self.global_cfg.get("implicit_compliance_markers", [])
+            m.casefold() for m in self.global_cfg.get("implicit_compliance_markers", [])
         ]
 
+        # Keyword lists compiled once into one alternation per intent.
+        # Intents are still tried in YAML order, so the first intent with
+        # any matching keyword wins exactly as with the substring loops.
+        # Violation-only results do not depend on the clause or state, so
+        # each matchable violation intent's result fields are built here.
+        self._violation_matchers = [
+            (pattern, cfg, self._build_violation_result(cfg))
+            for cfg in self.violation_intents.values()
+            if (pattern := _compile_keywords(cfg.get("keywords", [])))
+        ]
+        self._base_matchers = [
+            (pattern, intent_key, cfg)
+            for intent_key, cfg in self.base_intents.items()
+            if (pattern := _compile_keywords(cfg.get("keywords", [])))
+        ]
+        self._implicit_pattern = _compile_keywords(self.implicit_markers)
+
         self.default_risk = self.global_cfg.get(
             "default_risk_if_uncertain", "medium"
         )
 
+        # Conservative fallback for clauses matching no intent; shared
+        # read-only like every other cached result.
+        self._unknown_fields: Dict[str, Any] = {
+            "intent": "unknown",
+            "obligation_type": "unclear",
+            "risk_level": self.default_risk,
+            "needs_legal_validation": True,
+            "retrieval_queries": [],
+            "compliance_mode": "UNKNOWN",
+            "compliance_confidence": 0.0,
+            "statutory_basis": None,
+            "notes": ["No matching intent rule found"],
+        }
+
+        # (intent_key, state) -> base config with state overrides applied.
+        # Rules are static after load, so every merge is done here once;
+        # pairs without an override fall back to the base config.
+        self._effective_cfg: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for state_key, state_cfg in self.state_overrides.items():
+            if not state_cfg:
+                continue
+            for intent_key, base_cfg in self.base_intents.items():
+                override = state_cfg.get(intent_key)
+                if override:
+                    self._effective_cfg[(intent_key, state_key)] = {**base_cfg, **override}
+
+        # (intent_key, state) -> (risk slot, matchers) for the config's
+        # risk_rules, resolved once at load; base configs use state None.
+        # Configs without risk_rules have no entry and use default_risk.
+        self._risk_rules: Dict[Tuple[str, Optional[str]], Tuple[int, Tuple[Any, Any]]] = {}
+
+        # With pyahocorasick installed, violation, base-intent, implicit
+        # and risk keywords are matched together in one linear pass (see
+        # _scan). Ranks index into the matcher lists above and risk slots
+        # identify a risk_rules mapping, so YAML order and the
+        # high -> medium -> low priority still decide between hits.
+        self._scan_automaton = _build_tagged_automaton(self._scan_entries())
+
+        # (intent_key, state) -> retrieval queries; depends only on rules.
+        # Stateless queries are built up front, state variants on demand.
+        self._retrieval_query_cache: Dict[Tuple[str, Optional[str]], List[Dict[str, Any]]] = {
+            (intent_key, None): self._build_retrieval_queries(
+                intent_key=intent_key,
+                intent_cfg=cfg,
+                base_cfg=cfg,
+            )
+            for intent_key, cfg in self.base_intents.items()
+        }
+        # (intent_key, state) -> normalized statutory basis (or None).
+        self._basis_cache: Dict[Tuple[str, Optional[str]], Optional[Dict[str, Any]]] = {
+            (intent_key, None): self._build_statutory_basis(
+                intent_cfg=cfg,
+                effective_cfg=cfg,
+            )
+            for intent_key, cfg in self.base_intents.items()
+        }
+
+        # Classification is deterministic in (casefolded text, state);
+        # boilerplate clauses repeated across a contract hit this cache.
+        self._classify_cached = _weak_lru_cache(self._classify_fields, ANALYZE_CACHE_SIZE)
+
+    def clear_cache(self) -> None:
+        """Drop memoized clause classifications."""
+        self._classify_cached.cache_clear()
+
     # =========================================================
     # Public API
     # =========================================================
@@ -61,45 +338,96 @@ class IntentRuleEngine:
         clause_text: str,
         state: Optional[str] = None
     ) -> ClauseUnderstandingResult:
+        return self.classify_many([(clause_id, clause_text)], state)[0]
 
-        text = clause_text.lower()
+    def classify_many(
+        self,
+        items: List[Tuple[str, str]],
+        state: Optional[str] = None
+    ) -> List[ClauseUnderstandingResult]:
+        """
+        Analyze many (clause_id, clause_text) pairs for one state.
+
+        Repeated clause texts reuse a memoized classification, and clauses
+        resolving to the same intent share one cached set of retrieval
+        queries; only the result model is built per clause.
+        """
+        # State keys are normalized once per batch, not per clause.
+        state_key = sys.intern(state.lower()) if state else None
+        classify = self._classify_cached
+
+        if STRICT_SCHEMA:
+            return [
+                build_model(
+                    ClauseUnderstandingResult,
+                    {"clause_id": clause_id, **classify(clause_text.casefold(), state_key)},
+                    strict=STRICT_SCHEMA,
+                    log_fn=log_schema_drift
+                )
+                for clause_id, clause_text in items
+            ]
+
+        # Trusted path: fields are engine-built and drift-checked on cache
+        # miss, so skip re-validation. Nested containers are shared between
+        # results for the same clause text and must be treated as read-only.
+        construct = ClauseUnderstandingResult.model_construct
+        return [
+            construct(clause_id=clause_id, **classify(clause_text.casefold(), state_key))
+            for clause_id, clause_text in items
+        ]
+
+    def _classify_fields(
+        self,
+        text: str,
+        state: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        _classify() plus the schema-drift check build_model would apply,
+        run once per distinct (text, state) rather than once per clause.
+        """
+        data = self._classify(text, state)
+        if STRICT_SCHEMA:
+            # build_model validates (and raises on drift) per result.
+            return data
+
+        extras = data.keys() - _RESULT_FIELDS
+        if extras:
+            log_schema_drift(
+                f"[SCHEMA-DRIFT] {ClauseUnderstandingResult.__name__} received extra fields: "
+                f"{sorted(extras)}"
+            )
+            data = {k: v for k, v in data.items() if k in _RESULT_FIELDS}
+
+        return data
+
+    def _classify(
+        self,
+        text: str,
+        state: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Classify one clause into result fields (everything but clause_id).
+        `text` is already casefolded and `state` already lowercased by
+        classify_many(). Returned dicts are cached and must not be mutated.
+        """
 
         # -----------------------------------------------------
         # 1️⃣ Violation-only intents (highest priority)
         # -----------------------------------------------------
-        violation_cfg = self._match_violation_intent(text)
-        if violation_cfg:
-            return self._build_violation_result(
-                clause_id=clause_id,
-                violation_cfg=violation_cfg
-            )
+        hits = self._scan(text)
+
+        violation_fields = self._match_violation_intent(text, hits)
+        if violation_fields:
+            return violation_fields
 
         # -----------------------------------------------------
         # 2️⃣ Base intent detection
         # -----------------------------------------------------
-        intent_key, base_cfg = self._match_base_intent(text)
+        intent_key, base_cfg = self._match_base_intent(text, hits)
 
         if not intent_key:
             # Conservative fallback
-            data = {
-                "clause_id": clause_id,
-                "intent": "unknown",
-                "obligation_type": "unclear",
-                "risk_level": self.default_risk,
-                "needs_legal_validation": True,
-                "retrieval_queries": [],
-                "compliance_mode": "UNKNOWN",
-                "compliance_confidence": 0.0,
-                "statutory_basis": None,
-                "notes": ["No matching intent rule found"],
-            }
-
-            return build_model(
-                ClauseUnderstandingResult,
-                data,
-                strict=STRICT_SCHEMA,
-                log_fn=log_schema_drift
-            )
+            return self._unknown_fields
 
         # -----------------------------------------------------
         # 3️⃣ Apply state overrides (RULES ONLY)
@@ -113,12 +441,16 @@ class IntentRuleEngine:
         # -----------------------------------------------------
         # 4️⃣ Compliance mode
         # -----------------------------------------------------
-        compliance_mode = self._detect_compliance_mode(text)
+        compliance_mode = self._detect_compliance_mode(text, hits)
 
         # -----------------------------------------------------
         # 5️⃣ Risk level
         # -----------------------------------------------------
-        risk_level = self._determine_risk(text, effective_cfg)
+        risk_level = self._determine_risk(
+            text,
+            (intent_key, None if effective_cfg is base_cfg else state),
+            hits,
+        )
 
         # -----------------------------------------------------
         # 6️⃣ Obligation type
@@ -138,25 +470,38 @@ class IntentRuleEngine:
         # -----------------------------------------------------
         # 8️⃣ Retrieval queries
         # -----------------------------------------------------
-        retrieval_queries = self._build_retrieval_queries(
-            intent_key=intent_key,
-            intent_cfg=effective_cfg,
-            base_cfg=base_cfg,
-        )
+        cache_key = (intent_key, state)
+        retrieval_queries = self._retrieval_query_cache.get(cache_key)
+        if retrieval_queries is None:
+            if effective_cfg is base_cfg:
+                # No override for this state: reuse the load-time queries.
+                retrieval_queries = self._retrieval_query_cache[(intent_key, None)]
+            else:
+                retrieval_queries = self._build_retrieval_queries(
+                    intent_key=intent_key,
+                    intent_cfg=effective_cfg,
+                    base_cfg=base_cfg,
+                )
+            self._retrieval_query_cache[cache_key] = retrieval_queries
 
         # -----------------------------------------------------
         # 🔑 9️⃣ STATUTORY BASIS (CENTRAL + STATE)
         # -----------------------------------------------------
-        statutory_basis = self._build_statutory_basis(
-            intent_cfg=base_cfg,
-            effective_cfg=effective_cfg
-        )
+        if effective_cfg is base_cfg:
+            statutory_basis = self._basis_cache[(intent_key, None)]
+        elif cache_key in self._basis_cache:
+            statutory_basis = self._basis_cache[cache_key]
+        else:
+            statutory_basis = self._build_statutory_basis(
+                intent_cfg=base_cfg,
+                effective_cfg=effective_cfg
+            )
+            self._basis_cache[cache_key] = statutory_basis
 
         # -----------------------------------------------------
         # 10️⃣ Final result
         # -----------------------------------------------------
-        data = {
-            "clause_id": clause_id,
+        return {
             "intent": effective_cfg.get("intent_name", intent_key),
             "obligation_type": obligation_type,
             "risk_level": risk_level,
@@ -168,29 +513,101 @@ class IntentRuleEngine:
             "notes": [],
         }
 
-        return build_model(
-            ClauseUnderstandingResult,
-            data,
-            strict=STRICT_SCHEMA,
-            log_fn=log_schema_drift
-        )
+    # =========================================================
+    # Single-pass keyword scan
+    # =========================================================
+
+    def _scan_entries(self) -> List[Tuple[str, Tuple[int, int, int]]]:
+        """
+        (keyword, tag) pairs for every rule class. Also resolves
+        _risk_rules: each distinct risk_rules mapping in the base and
+        state-merged configs gets one slot and one set of matchers.
+        """
+        entries = []
+        for rank, (_, cfg, _) in enumerate(self._violation_matchers):
+            entries += [(kw, (_HIT_VIOLATION, 0, rank)) for kw in cfg.get("keywords", [])]
+        for rank, (_, _, cfg) in enumerate(self._base_matchers):
+            entries += [(kw, (_HIT_BASE, 0, rank)) for kw in cfg.get("keywords", [])]
+        entries += [(kw, (_HIT_IMPLICIT, 0, 0)) for kw in self.implicit_markers]
+
+        rule_cfgs = [
+            ((intent_key, None), cfg) for intent_key, cfg in self.base_intents.items()
+        ] + list(self._effective_cfg.items())
+        # Merged configs share risk_rules mappings by reference; the
+        # mappings stay alive in self.rules, so ids are stable while loading.
+        resolved_by_id: Dict[int, Tuple[int, Tuple[Any, Any]]] = {}
+        for key, cfg in rule_cfgs:
+            rules = cfg.get("risk_rules")
+            if not rules:
+                continue
+            resolved = resolved_by_id.get(id(rules))
+            if resolved is None:
+                slot = len(resolved_by_id)
+                resolved = resolved_by_id[id(rules)] = (slot, self._risk_matchers(rules))
+                for rank, level in enumerate(_RISK_LEVELS):
+                    entries += [(kw, (_HIT_RISK, slot, rank)) for kw in rules.get(level, [])]
+            self._risk_rules[key] = resolved
+
+        return entries
+
+    def _scan(self, text: str) -> Optional[Tuple[Any, ...]]:
+        """
+        Match every rule class against text in one automaton pass.
+
+        Returns (violation rank, base-intent rank, implicit marker found,
+        {risk slot: best level rank}), indexed by the _HIT_* constants, or
+        None when the regex matchers are in use.
+        """
+        automaton = self._scan_automaton
+        if automaton is None:
+            return None
+
+        violation = base = None
+        implicit = False
+        risk: Dict[int, int] = {}
+        for _, tags in automaton.iter(text):
+            for category, slot, rank in tags:
+                if category == _HIT_VIOLATION:
+                    if violation is None or rank < violation:
+                        violation = rank
+                elif category == _HIT_BASE:
+                    if base is None or rank < base:
+                        base = rank
+                elif category == _HIT_IMPLICIT:
+                    implicit = True
+                elif rank < risk.get(slot, len(_RISK_LEVELS)):
+                    risk[slot] = rank
+            if violation == 0:
+                # Top violation intent decides the result on its own.
+                break
+
+        return violation, base, implicit, risk
 
     # =========================================================
     # Violation-only intents
     # =========================================================
 
-    def _match_violation_intent(self, text: str) -> Optional[Dict[str, Any]]:
-        for cfg in self.violation_intents.values():
-            for kw in cfg.get("keywords", []):
-                if kw.lower() in text:
-                    return cfg
+    def _match_violation_intent(
+        self,
+        text: str,
+        hits: Optional[Tuple[Any, ...]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Prebuilt result fields of the first matching violation-only intent.
+        """
+        if hits is not None:
+            rank = hits[_HIT_VIOLATION]
+            return None if rank is None else self._violation_matchers[rank][2]
+
+        for pattern, _, fields in self._violation_matchers:
+            if pattern.search(text):
+                return fields
         return None
 
     def _build_violation_result(
         self,
-        clause_id: str,
         violation_cfg: Dict[str, Any]
-    ) -> ClauseUnderstandingResult:
+    ) -> Dict[str, Any]:
 
         violated = violation_cfg.get("violated_laws", {}) or {}
         statutory_basis = None
@@ -217,8 +634,7 @@ class IntentRuleEngine:
             filter(None, [intent_name, " ".join(sections), " ".join(phrases)])
         ).strip()
 
-        data = {
-            "clause_id": clause_id,
+        return {
             "intent": intent_name,
             "obligation_type": "promoter",
             "risk_level": violation_cfg.get("risk_level", "high"),
@@ -238,22 +654,25 @@ class IntentRuleEngine:
             "notes": ["Violation-only intent detected"],
         }
 
-        return build_model(
-            ClauseUnderstandingResult,
-            data,
-            strict=STRICT_SCHEMA,
-            log_fn=log_schema_drift
-        )
-
     # =========================================================
     # Base intent matching
     # =========================================================
 
-    def _match_base_intent(self, text: str):
-        for intent_key, cfg in self.base_intents.items():
-            for kw in cfg.get("keywords", []):
-                if kw.lower() in text:
-                    return intent_key, cfg
+    def _match_base_intent(
+        self,
+        text: str,
+        hits: Optional[Tuple[Any, ...]] = None
+    ):
+        if hits is not None:
+            rank = hits[_HIT_BASE]
+            if rank is None:
+                return None, None
+            _, intent_key, cfg = self._base_matchers[rank]
+            return intent_key, cfg
+
+        for pattern, intent_key, cfg in self._base_matchers:
+            if pattern.search(text):
+                return intent_key, cfg
         return None, None
 
     # =========================================================
@@ -270,17 +689,8 @@ class IntentRuleEngine:
         if not state:
             return base_cfg
 
-        state_cfg = self.state_overrides.get(state.lower())
-        if not state_cfg:
-            return base_cfg
-
-        override = state_cfg.get(intent_key)
-        if not override:
-            return base_cfg
-
-        merged = dict(base_cfg)
-        merged.update(override)
-        return merged
+        # Effective configs are read-only downstream; one per key.
+        return self._effective_cfg.get((intent_key, state), base_cfg)
 
     # =========================================================
     # Statutory basis builder (NEW)
@@ -322,10 +732,16 @@ class IntentRuleEngine:
     # Compliance mode detection
     # =========================================================
 
-    def _detect_compliance_mode(self, text: str) -> str:
-        for marker in self.implicit_markers:
-            if marker in text:
-                return "IMPLICIT"
+    def _detect_compliance_mode(
+        self,
+        text: str,
+        hits: Optional[Tuple[Any, ...]] = None
+    ) -> str:
+        if hits is not None:
+            return "IMPLICIT" if hits[_HIT_IMPLICIT] else "UNKNOWN"
+
+        if self._implicit_pattern and self._implicit_pattern.search(text):
+            return "IMPLICIT"
         return "UNKNOWN"
 
     # =========================================================
@@ -335,18 +751,49 @@ class IntentRuleEngine:
     def _determine_risk(
         self,
         text: str,
-        intent_cfg: Dict[str, Any]
+        risk_key: Tuple[str, Optional[str]],
+        hits: Optional[Tuple[Any, ...]] = None
     ) -> str:
+        """
+        Risk level for the config at risk_key: (intent_key, state) for a
+        state-merged config, (intent_key, None) for a base config.
+        """
+        resolved = self._risk_rules.get(risk_key)
+        if resolved is None:
+            return self.default_risk
+        slot, (automaton, patterns) = resolved
 
-        rules = intent_cfg.get("risk_rules", {})
+        if hits is not None:
+            rank = hits[_HIT_RISK].get(slot)
+            return self.default_risk if rank is None else _RISK_LEVELS[rank]
 
-        for level in ("high", "medium", "low"):
-            for phrase in rules.get(level, []):
-                if phrase.lower() in text:
-                    return level
+        if automaton is not None:
+            rank = _first_match_rank(automaton, text)
+            return self.default_risk if rank is None else _RISK_LEVELS[rank]
+
+        for level, pattern in patterns:
+            if pattern.search(text):
+                return level
 
         return self.default_risk
 
+    def _risk_matchers(self, rules: Dict[str, Any]):
+        """
+        Matchers for a risk_rules block, in high -> medium -> low priority:
+        (automaton, None) when pyahocorasick is installed, otherwise
+        (None, [(level, pattern), ...]). Built once per mapping at load.
+        """
+        automaton = _build_automaton([rules.get(level, []) for level in _RISK_LEVELS])
+        patterns = None
+        if automaton is None:
+            patterns = [
+                (level, pattern)
+                for level in _RISK_LEVELS
+                if (pattern := _compile_keywords(rules.get(level, [])))
+            ]
+
+        return automaton, patterns
+
     # =========================================================
     # Retrieval query builder
     # =========================================================
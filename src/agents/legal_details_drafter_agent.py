@@ -1,5 +1,38 @@
-import subprocess
+import re
 import textwrap
+from typing import List, Tuple
+
+from tools.ollama_client import OllamaError, generate
+
+
+# Single-clause prompt skeleton, dedented once at import.
+_DRAFT_PROMPT_TPL = textwrap.dedent("""
+    You are a legal assistant helping analyze Indian real estate contracts.
+
+    STRICT RULES:
+    - Use ONLY the provided evidence
+    - Do NOT invent laws or clauses
+    - Do NOT give final legal conclusions
+    - Write a structured draft explanation
+
+    CONTRACT CLAUSE:
+    ----------------
+    {clause_text}
+
+    LEGAL EVIDENCE:
+    ----------------
+    {evidence_text}
+
+    DRAFT EXPLANATION:
+    """)
+
+# Splits a batched completion into its "### DRAFT <n>" sections. Models
+# often title or bold the header ("### DRAFT 1: Delay clause",
+# "**DRAFT 1**"), so anything after the number on that line is ignored.
+_DRAFT_HEADER_RE = re.compile(
+    r"^[ \t]*(?:#{2,}[ \t]*(?:\*\*)?|\*\*)[ \t]*DRAFT[ \t]+(\d+)\b.*$",
+    re.MULTILINE | re.IGNORECASE,
+)
 
 
 class LocalLLMAdapter:
@@ -31,37 +64,87 @@ class LocalLLMAdapter:
             >>> adapter.generate_draft("Delay clause", "Evidence 1...")
             'The clause indicates...'
         """
+        return self.generate_drafts_batch([(clause_text, evidence_text)])[0]
 
-        prompt = textwrap.dedent(f"""
-        You are a legal assistant helping analyze Indian real estate contracts.
-
-        STRICT RULES:
-        - Use ONLY the provided evidence
-        - Do NOT invent laws or clauses
-        - Do NOT give final legal conclusions
-        - Write a structured draft explanation
+    def generate_drafts_batch(
+        self,
+        items: List[Tuple[str, str]]
+    ) -> List[str]:
+        """
+        Generate drafts for many (clause_text, evidence_text) pairs with a
+        single model call.
 
-        CONTRACT CLAUSE:
-        ----------------
-        {clause_text}
+        Clauses are sent as numbered CLAUSE/EVIDENCE blocks and the model
+        answers with matching "### DRAFT <n>" sections. Any draft missing
+        from the batched answer is generated on its own.
 
-        LEGAL EVIDENCE:
-        ----------------
-        {evidence_text}
+        Example:
+            >>> adapter.generate_drafts_batch([("Delay clause", "Evidence 1...")])
+            ['The clause indicates...']
+        """
+        if not items:
+            return []
 
-        DRAFT EXPLANATION:
-        """)
+        if len(items) == 1:
+            clause_text, evidence_text = items[0]
+            return [self._generate(self._single_prompt(clause_text, evidence_text))]
 
-        result = subprocess.run(
-            ["ollama", "run", self.MODEL],
-            input=prompt,
-            text=True,
-            capture_output=True
+        drafts = self._split_drafts(
+            self._generate(self._batch_prompt(items)),
+            len(items),
         )
 
-        if result.returncode != 0:
+        return [
+            draft if draft else self._generate(self._single_prompt(*item))
+            for draft, item in zip(drafts, items)
+        ]
+
+    # -------------------------------------------------
+    # Prompting
+    # -------------------------------------------------
+
+    def _generate(self, prompt: str) -> str:
+        try:
+            return generate(self.MODEL, prompt).strip()
+        except OllamaError as e:
             raise RuntimeError(
-                f"Local LLM error: {result.stderr}"
-            )
+                f"Local LLM error: {e}"
+            ) from e
+
+    def _single_prompt(self, clause_text: str, evidence_text: str) -> str:
+        return _DRAFT_PROMPT_TPL.format(
+            clause_text=clause_text,
+            evidence_text=evidence_text,
+        )
 
-        return result.stdout.strip()
+    def _batch_prompt(self, items: List[Tuple[str, str]]) -> str:
+        blocks = "\n\n".join(
+            f"### CLAUSE {i}\n{clause_text}\n\n### EVIDENCE {i}\n{evidence_text}"
+            for i, (clause_text, evidence_text) in enumerate(items, start=1)
+        )
+        return (
+            "You are a legal assistant helping analyze Indian real estate contracts.\n\n"
+            "STRICT RULES:\n"
+            "- Use ONLY the evidence given for each clause\n"
+            "- Do NOT invent laws or clauses\n"
+            "- Do NOT give final legal conclusions\n"
+            "- Write a structured draft explanation for EVERY clause\n"
+            f"- Answer with exactly {len(items)} sections, each starting with a "
+            "line \"### DRAFT <n>\" matching the clause number\n\n"
+            f"{blocks}\n\n"
+            "DRAFT EXPLANATIONS:\n"
+        )
+
+    def _split_drafts(self, text: str, count: int) -> List[str]:
+        """
+        Map "### DRAFT <n>" sections back to clause positions; sections that
+        are missing or out of range come back as empty strings.
+        """
+        drafts = [""] * count
+        headers = list(_DRAFT_HEADER_RE.finditer(text))
+        for header, nxt in zip(headers, headers[1:] + [None]):
+            idx = int(header.group(1)) - 1
+            end = nxt.start() if nxt else len(text)
+            if 0 <= idx < count and not drafts[idx]:
+                drafts[idx] = text[header.end():end].strip()
+        return drafts
@@ -1,10 +1,109 @@
 import json
 import re
-import subprocess
 from typing import List
 
 from pydantic import BaseModel, Field, ValidationError, field_validator
 
+from tools.ollama_client import OllamaError, generate
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional speedup
+    _ORJSON_AVAILABLE = False
+
+
+def _json_loads(text: str):
+    """
+    Parse JSON, using orjson when installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    catch the same exception either way.
+    """
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dumps(data) -> str:
+    """
+    Serialize to a UTF-8 JSON string (non-ASCII kept as-is).
+    """
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, ensure_ascii=False)
+
+
+# LLM alignment spellings -> canonical labels (built once, not per validation).
+_ALIGNMENT_SYNONYMS = {
+    "aligned": "aligned",
+    "partial": "partially_aligned",
+    "partially aligned": "partially_aligned",
+    "partially_aligned": "partially_aligned",
+    "conflict": "conflicting",
+    "conflicting": "conflicting",
+    "insufficient": "insufficient_evidence",
+    "insufficient evidence": "insufficient_evidence",
+    "insufficient_evidence": "insufficient_evidence"
+}
+_CANONICAL_ALIGNMENTS = frozenset(_ALIGNMENT_SYNONYMS.values())
+
+# Refiner output keys; payloads using only these with already-normalized
+# values skip pydantic validation.
+_OUTPUT_KEYS = frozenset({"alignment", "key_findings", "explanation", "evidence_mapping"})
+_MAPPING_KEYS = frozenset({"claim", "evidence_id"})
+
+# Best-effort JSON recovery from chatty model output.
+_JSON_OBJ_RE = re.compile(r"\{.*\}", re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+
+
+# Prompt skeletons built once at import; only the dynamic fields are
+# substituted per call.
+_REFINE_PROMPT_TPL = """
+You are a senior Indian real estate legal expert specializing in RERA compliance.
+
+TASK:
+1. Review the draft explanation for accuracy against the legal evidence
+2. Correct any factual inaccuracies or misinterpretations
+3. Use only the provided legal evidence - DO NOT introduce new legal sources
+4. Return structured JSON that matches the required schema
+
+OUTPUT SCHEMA (JSON):
+{{
+  "alignment": "aligned | partially_aligned | conflicting | insufficient_evidence",
+  "key_findings": ["short bullet-like sentences"],
+  "explanation": "plain text explanation",
+  "evidence_mapping": [
+    {{
+      "claim": "statement in the explanation",
+      "evidence_id": "Evidence 1"
+    }}
+  ]
+}}
+
+RULES:
+- Use ONLY evidence IDs that appear in the LEGAL EVIDENCE section (e.g., "Evidence 1").
+- If evidence is insufficient, set alignment to "insufficient_evidence" and explain why.
+- Return ONLY valid JSON. No markdown, no extra text.
+
+CONTRACT CLAUSE:
+{clause_text}
+
+LEGAL EVIDENCE:
+{evidence_text}
+
+DRAFT EXPLANATION (TO REFINE):
+{draft_text}
+"""
+
+_RETRY_PROMPT_TPL = """
+Return ONLY valid JSON for the following output. Do not add any text.
+
+OUTPUT TO FIX:
+{raw}
+"""
+
 
 class OpenAIRefiner:
     """
@@ -40,18 +139,7 @@ class OpenAIRefiner:
         @field_validator("alignment", mode="before")
         def normalize_alignment(cls, value):
             text = str(value or "").lower().strip()
-            mapping = {
-                "aligned": "aligned",
-                "partial": "partially_aligned",
-                "partially aligned": "partially_aligned",
-                "partially_aligned": "partially_aligned",
-                "conflict": "conflicting",
-                "conflicting": "conflicting",
-                "insufficient": "insufficient_evidence",
-                "insufficient evidence": "insufficient_evidence",
-                "insufficient_evidence": "insufficient_evidence"
-            }
-            return mapping.get(text, text) if text else ""
+            return _ALIGNMENT_SYNONYMS.get(text, text) if text else ""
 
         @field_validator("key_findings", mode="before")
         def normalize_key_findings(cls, value) -> List[str]:
@@ -81,76 +169,30 @@ class OpenAIRefiner:
             >>> refiner.refine("draft", "clause", "evidence")
             '{"alignment": "aligned", ...}'
         """
-        prompt = f"""
-You are a senior Indian real estate legal expert specializing in RERA compliance.
-
-TASK:
-1. Review the draft explanation for accuracy against the legal evidence
-2. Correct any factual inaccuracies or misinterpretations
-3. Use only the provided legal evidence - DO NOT introduce new legal sources
-4. Return structured JSON that matches the required schema
-
-OUTPUT SCHEMA (JSON):
-{{
-  "alignment": "aligned | partially_aligned | conflicting | insufficient_evidence",
-  "key_findings": ["short bullet-like sentences"],
-  "explanation": "plain text explanation",
-  "evidence_mapping": [
-    {{
-      "claim": "statement in the explanation",
-      "evidence_id": "Evidence 1"
-    }}
-  ]
-}}
-
-RULES:
-- Use ONLY evidence IDs that appear in the LEGAL EVIDENCE section (e.g., "Evidence 1").
-- If evidence is insufficient, set alignment to "insufficient_evidence" and explain why.
-- Return ONLY valid JSON. No markdown, no extra text.
-
-CONTRACT CLAUSE:
-{clause_text}
-
-LEGAL EVIDENCE:
-{evidence_text}
-
-DRAFT EXPLANATION (TO REFINE):
-{draft_text}
-"""
-
-        response = subprocess.run(
-            ["ollama", "run", self.MODEL],
-            input=prompt,
-            text=True,
-            capture_output=True
+        prompt = _REFINE_PROMPT_TPL.format(
+            clause_text=clause_text,
+            evidence_text=evidence_text,
+            draft_text=draft_text,
         )
 
-        if response.returncode != 0:
+        try:
+            raw = generate(self.MODEL, prompt).strip()
+        except OllamaError as e:
             raise RuntimeError(
-                f"Ollama refiner error: {response.stderr}"
-            )
+                f"Ollama refiner error: {e}"
+            ) from e
 
-        raw = response.stdout.strip()
         try:
             return self._extract_json(raw)
         except (ValueError, json.JSONDecodeError):
             # One retry with a stricter JSON-only prompt
-            retry_prompt = f"""
-Return ONLY valid JSON for the following output. Do not add any text.
-
-OUTPUT TO FIX:
-{raw}
-"""
-            retry = subprocess.run(
-                ["ollama", "run", self.MODEL],
-                input=retry_prompt,
-                text=True,
-                capture_output=True
-            )
-            if retry.returncode != 0:
+            retry_prompt = _RETRY_PROMPT_TPL.format(raw=raw)
+            try:
+                retry = generate(self.MODEL, retry_prompt)
+            except OllamaError:
                 return self._fallback_json()
             try:
-                return self._extract_json(retry.stdout.strip())
+                return self._extract_json(retry.strip())
             except (ValueError, json.JSONDecodeError):
                 return self._fallback_json()
 
@@ -165,18 +207,18 @@ OUTPUT TO FIX:
         """
         text = text.strip()
         try:
-            parsed = json.loads(text)
+            parsed = _json_loads(text)
             return self._normalize_output(parsed)
         except json.JSONDecodeError:
             pass
 
-        match = re.search(r"\{.*\}", text, flags=re.DOTALL)
+        match = _JSON_OBJ_RE.search(text)
         if match:
             candidate = match.group(0)
             sanitized = candidate.replace("\t", " ")
-            sanitized = re.sub(r",\s*([}\]])", r"\1", sanitized)
+            sanitized = _TRAILING_COMMA_RE.sub(r"\1", sanitized)
             try:
-                parsed = json.loads(sanitized)
+                parsed = _json_loads(sanitized)
                 return self._normalize_output(parsed)
             except json.JSONDecodeError:
                 pass
@@ -201,7 +243,7 @@ OUTPUT TO FIX:
             ),
             "evidence_mapping": []
         }
-        return json.dumps(data, ensure_ascii=False)
+        return _json_dumps(data)
 
     def _normalize_output(self, parsed: dict) -> str:
         """
@@ -210,19 +252,21 @@ OUTPUT TO FIX:
         Returns:
             A JSON string after Pydantic validation and normalization.
         """
-        try:
-            model = self.LLMOutput.model_validate(parsed)
-        except ValidationError:
-            # Best-effort fallback if model returns a nested/unknown schema.
-            model = self.LLMOutput(
-                alignment="insufficient_evidence",
-                key_findings=["Unable to parse model output reliably."],
-                explanation=(
-                    "The explanation output did not match the required schema. "
-                    "Please retry or inspect the raw model output."
-                ),
-                evidence_mapping=[]
-            )
+        model = self._construct_trusted(parsed)
+        if model is None:
+            try:
+                model = self.LLMOutput.model_validate(parsed)
+            except ValidationError:
+                # Best-effort fallback if model returns a nested/unknown schema.
+                model = self.LLMOutput(
+                    alignment="insufficient_evidence",
+                    key_findings=["Unable to parse model output reliably."],
+                    explanation=(
+                        "The explanation output did not match the required schema. "
+                        "Please retry or inspect the raw model output."
+                    ),
+                    evidence_mapping=[]
+                )
 
         data = model.model_dump()
         if not data.get("alignment"):
@@ -232,4 +276,56 @@ OUTPUT TO FIX:
         if not data.get("key_findings"):
             data["key_findings"] = ["No key findings provided."]
 
-        return json.dumps(data, ensure_ascii=False)
+        return _json_dumps(data)
+
+    def _construct_trusted(self, parsed) -> "OpenAIRefiner.LLMOutput | None":
+        """
+        Build LLMOutput without validation when the payload already has
+        the exact schema shape and canonical values, i.e. when validation
+        would be a no-op. Returns None for anything that needs coercion.
+        """
+        if not isinstance(parsed, dict) or not parsed.keys() <= _OUTPUT_KEYS:
+            return None
+
+        alignment = parsed.get("alignment")
+        if alignment is not None and not (
+            type(alignment) is str and alignment in _CANONICAL_ALIGNMENTS
+        ):
+            return None
+
+        explanation = parsed.get("explanation")
+        if explanation is not None and type(explanation) is not str:
+            return None
+
+        key_findings = parsed.get("key_findings", [])
+        if type(key_findings) is not list or not all(
+            type(f) is str for f in key_findings
+        ):
+            return None
+
+        raw_mapping = parsed.get("evidence_mapping", [])
+        if type(raw_mapping) is not list:
+            return None
+        mapping = []
+        for item in raw_mapping:
+            if (
+                type(item) is not dict
+                or item.keys() != _MAPPING_KEYS
+                or type(item["claim"]) is not str
+                or type(item["evidence_id"]) is not str
+            ):
+                return None
+            mapping.append(self.EvidenceMapping.model_construct(**item))
+
+        return self.LLMOutput.model_construct(
+            alignment=alignment,
+            key_findings=key_findings,
+            explanation=explanation,
+            evidence_mapping=mapping,
+        )
+
+
+# LLMOutput forward-references OpenAIRefiner.EvidenceMapping, which only
+# resolves once the outer class exists; build its schema at import so the
+# first refine() does not pay for it.
+OpenAIRefiner.LLMOutput.model_rebuild()
@@ -1,5 +1,12 @@
+import math
+from bisect import bisect_right
+from functools import lru_cache
+from operator import attrgetter
 from typing import Optional, Tuple, List, Dict, Any
 
+import numpy as np
+from pydantic import TypeAdapter
+
 from tools.logger import setup_logger
 from RAG.contract_analysis import ClauseAnalysisResult
 
@@ -10,6 +17,219 @@ from configs.schema_config import STRICT_SCHEMA
 
 logger = setup_logger("legal-explanation-agent")
 
+# compliance_mode -> (stance, alignment) for modes that fix both
+# regardless of confidence or retrieval diagnostics. Looked up once per
+# clause instead of comparing the mode string in each helper.
+_FIXED_BY_MODE = {"CONTRADICTION": ("VIOLATION", "contradiction")}
+
+# Confidence cut-offs (inclusive) and the stance for each bucket.
+_STANCE_THRESHOLDS = (0.5, 0.8)
+_STANCE_LABELS = ("WARNING", "CAUTIOUS", "ASSERTIVE")
+
+# (coverage, anchor_match) -> alignment for every other mode.
+_ALIGNMENT_BY_DIAGNOSTICS = {
+    (True, True): "aligned",
+    (True, False): "partially_aligned",
+    (False, True): "insufficient_evidence",
+    (False, False): "insufficient_evidence",
+}
+
+_RESULT_FIELDS = frozenset(ClauseAnalysisResult.model_fields)
+
+# Validates a whole batch of explain payloads in one core-validator pass.
+_RESULT_LIST_ADAPTER = TypeAdapter(List[ClauseAnalysisResult])
+
+# Evidence -> (source, ref) for citations, read in C per evidence.
+_CITATION_FIELDS = attrgetter("source", "section_or_clause")
+
+# Evidence doc types treated as statutory when picking snippets.
+_STATUTORY_DOC_TYPES = frozenset({"rera_act", "state_rule"})
+
+
+# =========================================================
+# Lawyer-grade templates
+# =========================================================
+
+# Plain-language summary per stance.
+_SUMMARY_TEMPLATES = {
+    "ASSERTIVE": "This clause complies with RERA requirements relating to {intent}.",
+    "CAUTIOUS": (
+        "This clause broadly aligns with RERA provisions on {intent}, "
+        "but could benefit from clearer wording."
+    ),
+    "WARNING": "This clause may pose legal risk in relation to {intent}.",
+    "VIOLATION": "This clause may conflict with mandatory RERA protections.",
+}
+
+# Legal explanation parts per stance: (opening, statutory sentence).
+_LEGAL_PARTS = {
+    "ASSERTIVE": (
+        "The clause addresses {intent} and reflects protections provided under "
+        "the Real Estate (Regulation and Development) Act, 2016.",
+        " It preserves statutory rights under {statutory}.",
+    ),
+    "CAUTIOUS": (
+        "The clause refers to {intent} but relies on statutory incorporation "
+        "rather than explicit contractual wording.",
+        " Relevant statutory provisions include {statutory}.",
+    ),
+    "WARNING": (
+        "The clause relates to {intent}, but its alignment with RERA protections "
+        "is unclear and may affect enforceability.",
+        " This may dilute rights conferred under {statutory}.",
+    ),
+    "VIOLATION": (
+        "The clause appears to restrict or waive rights guaranteed under RERA. "
+        "Such provisions are generally treated as unenforceable by RERA authorities.",
+        " This conflicts with {statutory}.",
+    ),
+}
+
+_PRECEDENT_TEMPLATE = "\n\nObserved RERA position: {precedent}"
+
+# Full legal explanation keyed on (stance, has_statutory, has_precedent),
+# pre-composed so each explanation is a single format call.
+_LEGAL_TEMPLATES = {
+    (stance, has_statutory, has_precedent): "".join((
+        opening,
+        statutory_tpl if has_statutory else "",
+        _PRECEDENT_TEMPLATE if has_precedent else "",
+    ))
+    for stance, (opening, statutory_tpl) in _LEGAL_PARTS.items()
+    for has_statutory in (False, True)
+    for has_precedent in (False, True)
+}
+
+# Observed RERA authority outcomes per intent (NOT fabricated case law).
+_PRECEDENT_MAP = {
+    "delay_in_possession": (
+        "RERA authorities have consistently held promoters liable for "
+        "possession delays where statutory remedies under Section 18 are "
+        "not explicitly preserved."
+    ),
+    "refund_and_withdrawal": (
+        "Authorities commonly award refund with interest where withdrawal "
+        "rights are restricted contrary to Section 18 of the Act."
+    ),
+    "unilateral_modification": (
+        "Unilateral modification clauses are frequently read down by "
+        "RERA authorities as being contrary to Section 14."
+    ),
+    "jurisdiction": (
+        "Clauses excluding RERA authority jurisdiction are routinely "
+        "held void in view of Sections 31 and 79 of the Act."
+    ),
+}
+
+# Recommended action per stance (constant, never formatted).
+_ACTION_NONE = "No action required."
+_ACTION_REVIEW = "Review this clause alongside the applicable RERA provisions."
+_ACTION_WARN = "Seek clarification or legal review before relying on this clause."
+_ACTION_VIOLATION = "Do not rely on this clause; seek immediate legal advice."
+
+_ACTIONS = {
+    "ASSERTIVE": _ACTION_NONE,
+    "CAUTIOUS": _ACTION_REVIEW,
+    "WARNING": _ACTION_WARN,
+    "VIOLATION": _ACTION_VIOLATION,
+}
+
+
+@lru_cache(maxsize=1024)
+def _explanation_texts(
+    stance: str,
+    intent: str,
+    statutory: Optional[str]
+) -> Tuple[str, str, str]:
+    """
+    (plain summary, legal explanation, recommended action) for a stance.
+
+    Inputs come from small vocabularies (stance, intent key, statutory
+    text) that repeat heavily across a contract, so results are memoized.
+    The precedent and the readable intent both derive from the intent key
+    and are resolved inside the cache.
+    """
+    precedent = _PRECEDENT_MAP.get(intent)
+    fields = {
+        "intent": intent.replace("_", " "),
+        "statutory": statutory,
+        "precedent": precedent,
+    }
+    legal = _LEGAL_TEMPLATES[(stance, bool(statutory), bool(precedent))].format_map(fields)
+    return _SUMMARY_TEMPLATES[stance].format_map(fields), legal, _ACTIONS[stance]
+
+
+# =========================================================
+# Result construction
+# =========================================================
+
+_OPTIONAL_TEXT_FIELDS = ("normalized_reference", "heading", "clause_role")
+
+
+def _without_drift(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    build_model's schema-drift handling, applied once for payloads that
+    share one key set: log extras, raise under STRICT_SCHEMA, else drop.
+    """
+    extras = rows[0].keys() - _RESULT_FIELDS
+    if not extras:
+        return rows
+
+    log_schema_drift(
+        f"[SCHEMA-DRIFT] {ClauseAnalysisResult.__name__} received extra fields: "
+        f"{sorted(extras)}"
+    )
+    if STRICT_SCHEMA:
+        raise ValueError(
+            f"Schema drift in {ClauseAnalysisResult.__name__}: {extras}"
+        )
+    return [
+        {k: v for k, v in row.items() if k in _RESULT_FIELDS}
+        for row in rows
+    ]
+
+
+def _is_unit_float(value) -> bool:
+    return type(value) is float and 0.0 <= value <= 1.0
+
+
+def _is_trusted(data: Dict[str, Any]) -> bool:
+    """
+    True when validation would accept data unchanged: every field the
+    agent does not build itself already has its declared type and range.
+    """
+    if type(data["clause_id"]) is not str or type(data["risk_level"]) is not str:
+        return False
+    for name in _OPTIONAL_TEXT_FIELDS:
+        value = data[name]
+        if value is not None and type(value) is not str:
+            return False
+
+    groundedness = data["groundedness_score"]
+    if not (
+        _is_unit_float(data["quality_score"])
+        and _is_unit_float(data["compliance_confidence"])
+        and _is_unit_float(data["semantic_confidence"])
+        and (groundedness is None or _is_unit_float(groundedness))
+    ):
+        return False
+
+    return all(
+        type(c["source"]) is str and type(c["ref"]) is str
+        for c in data["citations"]
+    )
+
+
+def _trusted_result(data: Dict[str, Any]) -> ClauseAnalysisResult:
+    """
+    Build the result without re-validating agent-built fields. Payloads
+    that validation would coerce or reject go through model_validate so
+    errors surface exactly as before.
+    """
+    if not _is_trusted(data):
+        return ClauseAnalysisResult.model_validate(data)
+    return ClauseAnalysisResult.model_construct(**data)
+
 
 class LegalExplanationAgent:
     """
@@ -23,6 +243,9 @@ class LegalExplanationAgent:
     - Emit STRICT ClauseAnalysisResult for aggregation & UI
     """
 
+    # Stateless: no per-instance __dict__.
+    __slots__ = ()
+
     # =========================================================
     # Public API
     # =========================================================
@@ -34,58 +257,160 @@ class LegalExplanationAgent:
         evidence_pack,
         retrieval_quality: Optional[Dict[str, Any]] = None,
     ) -> ClauseAnalysisResult:
+        data = self._build_payload(clause, clause_result, evidence_pack, retrieval_quality)
+        if STRICT_SCHEMA:
+            return build_model(
+                ClauseAnalysisResult,
+                data,
+                strict=STRICT_SCHEMA,
+                log_fn=log_schema_drift
+            )
+        return _trusted_result(_without_drift([data])[0])
 
-        # -------------------------------------------------
-        # 1.5️⃣ Effective confidence (lawyer-facing)
-        # -------------------------------------------------
-        compliance_conf = clause_result.compliance_confidence or 0.0
-        semantic_conf = (
-            getattr(clause_result, "semantic_confidence", None)
-            or getattr(clause, "semantic_confidence", None)
-            or getattr(clause, "confidence", 0.0)
+    def explain_batch(
+        self,
+        clauses: List[Any],
+        clause_results: List[Any],
+        evidence_packs: List[Any],
+        retrieval_qualities: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ) -> List[ClauseAnalysisResult]:
+        """
+        explain() for many clauses. Effective confidence and stance are
+        computed for the whole batch with NumPy, schema drift is checked
+        once per batch, and under STRICT_SCHEMA every payload is validated
+        in one pydantic list pass instead of one model_validate per clause.
+
+        Example:
+            >>> agent.explain_batch([chunk], [clause_result], [evidence_pack])
+            [ClauseAnalysisResult(...)]
+        """
+        if retrieval_qualities is None:
+            retrieval_qualities = [None] * len(clauses)
+
+        batch = list(zip(
+            clauses, clause_results, evidence_packs, retrieval_qualities, strict=True
+        ))
+        if not batch:
+            return []
+
+        semantic = [
+            self._semantic_confidence(clause, clause_result)
+            for clause, clause_result, _, _ in batch
+        ]
+        effective = np.minimum(
+            np.fromiter(
+                (cr.compliance_confidence or 0.0 for _, cr, _, _ in batch),
+                dtype=np.float64,
+                count=len(batch),
+            ),
+            np.asarray(semantic, dtype=np.float64),
+        )
+        np.minimum(
+            effective,
+            np.fromiter(
+                (rq.get("groundedness_score", 1.0) if rq else np.inf for *_, rq in batch),
+                dtype=np.float64,
+                count=len(batch),
+            ),
+            out=effective,
+        )
+        # Non-finite confidences (e.g. NaN) fall back to WARNING, as in
+        # _determine_stance.
+        stances = np.where(
+            np.isfinite(effective), np.digitize(effective, _STANCE_THRESHOLDS), 0
         )
 
-        effective_confidence = min(compliance_conf, semantic_conf)
-        if retrieval_quality:
-            effective_confidence = min(
-                effective_confidence,
-                retrieval_quality.get("groundedness_score", 1.0),
-            )
+        scores = zip(
+            semantic,
+            effective.tolist(),
+            [_STANCE_LABELS[i] for i in stances.tolist()],
+        )
+        rows = [
+            self._build_payload(*item, scores=item_scores)
+            for item, item_scores in zip(batch, scores)
+        ]
+
+        rows = _without_drift(rows)
+        if STRICT_SCHEMA:
+            return _RESULT_LIST_ADAPTER.validate_python(rows)
+        return [_trusted_result(row) for row in rows]
+
+    def _build_payload(
+        self,
+        clause,
+        clause_result,
+        evidence_pack,
+        retrieval_quality: Optional[Dict[str, Any]],
+        scores: Optional[Tuple[Any, float, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Unvalidated ClauseAnalysisResult fields for one clause.
+
+        scores is (semantic confidence, effective confidence, stance) when
+        explain_batch has already computed them for the whole batch.
+        """
+
+        # Clause-result fields are read once and passed down as values.
+        compliance_mode = clause_result.compliance_mode
+        intent = clause_result.intent
+        basis = normalize_statutory_basis(
+            getattr(clause_result, "statutory_basis", None)
+        )
 
         # -------------------------------------------------
-        # 1️⃣ Determine stance
+        # 1.5️⃣ Effective confidence (lawyer-facing)
         # -------------------------------------------------
-        stance = self._determine_stance(
-            compliance_confidence=effective_confidence,
-            compliance_mode=clause_result.compliance_mode
-        )
+        if scores:
+            semantic_conf, effective_confidence, stance = scores
+        else:
+            semantic_conf = self._semantic_confidence(clause, clause_result)
+            effective_confidence = min(
+                clause_result.compliance_confidence or 0.0, semantic_conf
+            )
+            if retrieval_quality:
+                effective_confidence = min(
+                    effective_confidence,
+                    retrieval_quality.get("groundedness_score", 1.0),
+                )
+            stance = None
 
         # -------------------------------------------------
-        # 2️⃣ Determine alignment
+        # 1️⃣ + 2️⃣ Determine stance and alignment
         # -------------------------------------------------
-        alignment = self._determine_alignment(
-            clause_result=clause_result,
-            evidence_pack=evidence_pack
-        )
-        if retrieval_quality and clause_result.compliance_mode != "CONTRADICTION":
-            if not retrieval_quality.get("coverage_ok", True) or not retrieval_quality.get("anchor_match", True):
-                alignment = "insufficient_evidence"
+        unknown_intent = intent == "unknown"
+        fixed = _FIXED_BY_MODE.get(compliance_mode)
+        if fixed:
+            stance, alignment = fixed
+        elif stance is None:
+            stance = self._determine_stance(
+                compliance_confidence=effective_confidence
+            )
 
         # -------------------------------------------------
         # 2b️⃣ Conservative downgrade for unknown intent
         # -------------------------------------------------
-        quality_score = effective_confidence
+        # Rounded once; min() with 0.5 commutes with rounding to 2 places,
+        # so the downgraded quality score needs no second round().
+        compliance_confidence = round(effective_confidence, 2)
+        quality_score = compliance_confidence
 
-        if clause_result.intent == "unknown":
+        if unknown_intent:
+            # Forced outright, so diagnostics are never consulted.
             alignment = "insufficient_evidence"
             quality_score = min(quality_score, 0.5)
+        elif not fixed:
+            alignment = self._determine_alignment(evidence_pack=evidence_pack)
+            if retrieval_quality:
+                if not retrieval_quality.get("coverage_ok", True) or not retrieval_quality.get("anchor_match", True):
+                    alignment = "insufficient_evidence"
 
         # -------------------------------------------------
         # 3️⃣ Build explanations (statute-aware)
         # -------------------------------------------------
         plain_summary, legal_explanation, recommended_action = (
             self._build_explanation(
-                clause_result=clause_result,
+                intent=intent,
+                basis=basis,
                 stance=stance,
                 alignment=alignment
             )
@@ -101,17 +426,20 @@ class LegalExplanationAgent:
         # -------------------------------------------------
         # 4️⃣ Build statutory references (for UI + lawyers)
         # -------------------------------------------------
-        statutory_refs = self._build_statutory_refs(clause_result)
+        statutory_refs = self._build_statutory_refs(basis)
 
         # -------------------------------------------------
         # 5️⃣ Build STRICT payload
         # -------------------------------------------------
         groundedness = getattr(evidence_pack, "grounding_score", 0.7)
+        # Clauses without retrieved evidence skip citation/snippet building.
+        evidences = evidence_pack.evidences
+        clause_id = clause.chunk_id
         data = {
-            "clause_id": clause.chunk_id,
+            "clause_id": clause_id,
             "normalized_reference": (
                 getattr(clause, "normalized_reference", None)
-                or f"Clause {clause.chunk_id}"
+                or f"Clause {clause_id}"
             ),
             "heading": getattr(clause, "title", None),
             "statutory_refs": [
@@ -125,8 +453,8 @@ class LegalExplanationAgent:
             "legal_explanation": legal_explanation,
 
             # Scores
-            "quality_score": round(quality_score, 2),
-            "compliance_confidence": round(effective_confidence, 2),
+            "quality_score": quality_score,
+            "compliance_confidence": compliance_confidence,
             "semantic_confidence": round(float(semantic_conf), 2),
             "groundedness_score": (
                 round(float(retrieval_quality.get("groundedness_score", 0.0)), 2)
@@ -138,33 +466,36 @@ class LegalExplanationAgent:
             "recommended_action": recommended_action,
 
             # Citations (statutes + retrieved evidence)
-            "citations": statutory_refs + [
-                {
-                    "source": ev.source,
-                    "ref": ev.section_or_clause
-                }
-                for ev in evidence_pack.evidences
-            ],
-            "evidence_snippets": self._build_evidence_snippets(evidence_pack),
+            "citations": statutory_refs,
+            "evidence_snippets": (
+                self._build_evidence_snippets(evidence_pack) if evidences else []
+            ),
             "groundedness": groundedness,
         }
 
-        return build_model(
-            ClauseAnalysisResult,
-            data,
-            strict=STRICT_SCHEMA,
-            log_fn=log_schema_drift
-        )
+        # Evidence citations are appended in place: the statutory list is
+        # owned by this payload, so no second list is allocated.
+        if evidences:
+            statutory_refs.extend(
+                {"source": source, "ref": ref}
+                for source, ref in map(_CITATION_FIELDS, evidences)
+            )
 
-    def _build_evidence_snippets(self, evidence_pack) -> List[str]:
+        return data
+
+    @staticmethod
+    def _build_evidence_snippets(evidence_pack) -> List[str]:
         snippets: List[str] = []
         for ev in getattr(evidence_pack, "evidences", []):
-            source = (getattr(ev, "source", "") or "").lower()
             metadata = getattr(ev, "metadata", None)
             doc_type = getattr(metadata, "doc_type", "") if metadata else ""
 
-            # Prefer statutory snippets first.
-            is_statutory = "rera" in source or doc_type in {"rera_act", "state_rule"}
+            # Prefer statutory snippets first; the doc-type check is a set
+            # lookup, so the source is only lowercased when it misses.
+            is_statutory = (
+                doc_type in _STATUTORY_DOC_TYPES
+                or "rera" in (getattr(ev, "source", "") or "").lower()
+            )
             if not is_statutory:
                 continue
 
@@ -179,7 +510,8 @@ class LegalExplanationAgent:
                 break
         return snippets
 
-    def _grounding_issues(self, retrieval_quality: Dict[str, Any]) -> List[str]:
+    @staticmethod
+    def _grounding_issues(retrieval_quality: Dict[str, Any]) -> List[str]:
         issues: List[str] = []
         if not retrieval_quality.get("coverage_ok", True):
             issues.append("Expected statutory material was not retrieved.")
@@ -201,42 +533,45 @@ class LegalExplanationAgent:
     # Stance determination
     # =========================================================
 
-    def _determine_stance(
-        self,
-        compliance_confidence: float,
-        compliance_mode: str
-    ) -> str:
-        if compliance_mode == "CONTRADICTION":
-            return "VIOLATION"
-        if compliance_confidence >= 0.8:
-            return "ASSERTIVE"
-        if compliance_confidence >= 0.5:
-            return "CAUTIOUS"
-        return "WARNING"
+    @staticmethod
+    def _semantic_confidence(clause, clause_result) -> float:
+        """
+        Semantic confidence from the clause result, else the chunk.
+
+        ClauseUnderstandingResult always declares semantic_confidence (set
+        by the clause agent), so it is read directly; getattr is only paid
+        on the rare fallback to chunk attributes.
+        """
+        return (
+            clause_result.semantic_confidence
+            or getattr(clause, "semantic_confidence", None)
+            or getattr(clause, "confidence", 0.0)
+        )
+
+    @staticmethod
+    def _determine_stance(compliance_confidence: float) -> str:
+        """
+        Confidence-bucketed stance for modes not fixed by _FIXED_BY_MODE.
+        Non-finite confidences (e.g. NaN) are treated as WARNING.
+        """
+        if not math.isfinite(compliance_confidence):
+            return _STANCE_LABELS[0]
+        return _STANCE_LABELS[bisect_right(_STANCE_THRESHOLDS, compliance_confidence)]
 
     # =========================================================
     # Alignment determination
     # =========================================================
 
-    def _determine_alignment(self, clause_result, evidence_pack) -> str:
+    @staticmethod
+    def _determine_alignment(evidence_pack) -> str:
+        """
+        Diagnostics-based alignment for modes not fixed by _FIXED_BY_MODE.
+        """
         diagnostics = getattr(evidence_pack, "diagnostics", {})
-
-        anchor_match = diagnostics.get("anchor_match", False)
-        coverage = diagnostics.get("coverage", False)
-
-        if clause_result.compliance_mode == "CONTRADICTION":
-            alignment = "contradiction"
-
-        elif coverage and anchor_match:
-            alignment = "aligned"
-
-        elif coverage and not anchor_match:
-            alignment = "partially_aligned"
-
-        else:
-            alignment = "insufficient_evidence"
-
-        return alignment
+        return _ALIGNMENT_BY_DIAGNOSTICS[(
+            bool(diagnostics.get("coverage", False)),
+            bool(diagnostics.get("anchor_match", False)),
+        )]
 
     # =========================================================
     # Explanation Builder (tiered + lawyer-safe)
@@ -244,133 +579,23 @@ class LegalExplanationAgent:
 
     def _build_explanation(
         self,
-        clause_result,
+        intent: str,
+        basis: Optional[Dict[str, Any]],
         stance: str,
         alignment: str
     ) -> Tuple[str, str, str]:
 
-        intent = clause_result.intent.replace("_", " ")
-        statutory_text = self._statutory_text(clause_result)
-        precedent = self._precedent_anchor(clause_result.intent)
-
-        # -----------------------------
-        # ASSERTIVE
-        # -----------------------------
-        if stance == "ASSERTIVE":
-            return (
-                f"This clause complies with RERA requirements relating to {intent}.",
-                self._assertive_text(intent, statutory_text, precedent),
-                "No action required."
-            )
-
-        # -----------------------------
-        # CAUTIOUS
-        # -----------------------------
-        if stance == "CAUTIOUS":
-            return (
-                f"This clause broadly aligns with RERA provisions on {intent}, "
-                f"but could benefit from clearer wording.",
-                self._cautious_text(intent, statutory_text, precedent),
-                "Review this clause alongside the applicable RERA provisions."
-            )
-
-        # -----------------------------
-        # WARNING
-        # -----------------------------
-        if stance == "WARNING":
-            return (
-                f"This clause may pose legal risk in relation to {intent}.",
-                self._warning_text(intent, statutory_text, precedent),
-                "Seek clarification or legal review before relying on this clause."
-            )
-
-        # -----------------------------
-        # VIOLATION
-        # -----------------------------
-        return (
-            "This clause may conflict with mandatory RERA protections.",
-            self._violation_text(statutory_text, precedent),
-            "Do not rely on this clause; seek immediate legal advice."
-        )
-
-    # =========================================================
-    # Lawyer-grade templates
-    # =========================================================
-
-    def _assertive_text(
-        self,
-        intent: str,
-        statutory: Optional[str],
-        precedent: Optional[str]
-    ) -> str:
-        text = (
-            f"The clause addresses {intent} and reflects protections provided under "
-            f"the Real Estate (Regulation and Development) Act, 2016."
-        )
-        if statutory:
-            text += f" It preserves statutory rights under {statutory}."
-        if precedent:
-            text += f"\n\nObserved RERA position: {precedent}"
-        return text
-
-    def _cautious_text(
-        self,
-        intent: str,
-        statutory: Optional[str],
-        precedent: Optional[str]
-    ) -> str:
-        text = (
-            f"The clause refers to {intent} but relies on statutory incorporation "
-            f"rather than explicit contractual wording."
-        )
-        if statutory:
-            text += f" Relevant statutory provisions include {statutory}."
-        if precedent:
-            text += f"\n\nObserved RERA position: {precedent}"
-        return text
-
-    def _warning_text(
-        self,
-        intent: str,
-        statutory: Optional[str],
-        precedent: Optional[str]
-    ) -> str:
-        text = (
-            f"The clause relates to {intent}, but its alignment with RERA protections "
-            f"is unclear and may affect enforceability."
-        )
-        if statutory:
-            text += f" This may dilute rights conferred under {statutory}."
-        if precedent:
-            text += f"\n\nObserved RERA position: {precedent}"
-        return text
-
-    def _violation_text(
-        self,
-        statutory: Optional[str],
-        precedent: Optional[str]
-    ) -> str:
-        text = (
-            "The clause appears to restrict or waive rights guaranteed under RERA. "
-            "Such provisions are generally treated as unenforceable by RERA authorities."
-        )
-        if statutory:
-            text += f" This conflicts with {statutory}."
-        if precedent:
-            text += f"\n\nObserved RERA position: {precedent}"
-        return text
+        return _explanation_texts(stance, intent, self._statutory_text(basis))
 
     # =========================================================
     # Statutory anchoring
     # =========================================================
 
-    def _statutory_text(self, clause_result) -> Optional[str]:
+    @staticmethod
+    def _statutory_text(basis: Optional[Dict[str, Any]]) -> Optional[str]:
         """
-        Converts statutory_basis into readable legal text.
+        Converts a normalized statutory_basis into readable legal text.
         """
-        basis = normalize_statutory_basis(
-            getattr(clause_result, "statutory_basis", None)
-        )
         if not basis:
             return None
 
@@ -386,14 +611,15 @@ class LegalExplanationAgent:
 
         return " ".join(parts) if parts else None
 
-    def _build_statutory_refs(self, clause_result) -> List[Dict[str, str]]:
+    @staticmethod
+    def _build_statutory_refs(
+        basis: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, str]]:
         """
-        Structured statutory citations for UI / downstream systems.
+        Structured statutory citations (from a normalized statutory_basis)
+        for UI / downstream systems.
         """
         refs = []
-        basis = normalize_statutory_basis(
-            getattr(clause_result, "statutory_basis", None)
-        )
         if not basis:
             return refs
 
@@ -405,32 +631,3 @@ class LegalExplanationAgent:
             refs.append({"source": "State RERA Rules", "ref": rule})
 
         return refs
-
-    # =========================================================
-    # Precedent anchoring (observational)
-    # =========================================================
-
-    def _precedent_anchor(self, intent: str) -> Optional[str]:
-        """
-        Observed RERA authority outcomes (NOT fabricated case law).
-        """
-        PRECEDENT_MAP = {
-            "delay_in_possession": (
-                "RERA authorities have consistently held promoters liable for "
-                "possession delays where statutory remedies under Section 18 are "
-                "not explicitly preserved."
-            ),
-            "refund_and_withdrawal": (
-                "Authorities commonly award refund with interest where withdrawal "
-                "rights are restricted contrary to Section 18 of the Act."
-            ),
-            "unilateral_modification": (
-                "Unilateral modification clauses are frequently read down by "
-                "RERA authorities as being contrary to Section 14."
-            ),
-            "jurisdiction": (
-                "Clauses excluding RERA authority jurisdiction are routinely "
-                "held void in view of Sections 31 and 79 of the Act."
-            ),
-        }
-        return PRECEDENT_MAP.get(intent)
@@ -1,6 +1,14 @@
-ALLOWED_ALIGNMENTS = {
-    "aligned",
-    "partially_aligned",
-    "insufficient_evidence",
-    "contradiction",
-}
\ No newline at end of file
+ALIGNED = "aligned"
+PARTIALLY_ALIGNED = "partially_aligned"
+INSUFFICIENT_EVIDENCE = "insufficient_evidence"
+CONTRADICTION = "contradiction"
+
+# Legacy/LLM spelling of CONTRADICTION.
+CONFLICTING = "conflicting"
+
+ALLOWED_ALIGNMENTS = frozenset({
+    ALIGNED,
+    PARTIALLY_ALIGNED,
+    INSUFFICIENT_EVIDENCE,
+    CONTRADICTION,
+})
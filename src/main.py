@@ -108,13 +108,18 @@ class ContractRiskAnalysisSystem:
         chunks: List[ContractChunk] = self.chunker.chunk(contract_text)
         logger.info(f"Generated {len(chunks)} contract chunks")
 
-        results: List[ClauseAnalysisResult] = []
+        # Explanation inputs are collected per clause and explained in one
+        # batch so the result models are validated in a single pass.
+        explain_chunks = []
+        clause_results = []
+        evidence_packs = []
+        retrieval_qualities = []
 
         # 2️⃣ Process each chunk independently
         for chunk in chunks:
-            logger.info(f"Processing clause: {chunk.chunk_id}")
+            logger.info("Processing clause: %s", chunk.chunk_id)
             if not is_semantic_chunk(chunk):
-                logger.warning(f"Skipping non-semantic chunk: {chunk.chunk_id}")
+                logger.warning("Skipping non-semantic chunk: %s", chunk.chunk_id)
                 continue
             
 
@@ -134,14 +139,17 @@ class ContractRiskAnalysisSystem:
                 chunk=chunk,
             )
 
-            clause_analysis = self.explanation_agent.explain(
-                clause=chunk,
-                clause_result=clause_result,
-                evidence_pack=evidence_pack,
-                retrieval_quality=retrieval_quality,
-            )
+            explain_chunks.append(chunk)
+            clause_results.append(clause_result)
+            evidence_packs.append(evidence_pack)
+            retrieval_qualities.append(retrieval_quality)
 
-            results.append(clause_analysis)
+        results: List[ClauseAnalysisResult] = self.explanation_agent.explain_batch(
+            explain_chunks,
+            clause_results,
+            evidence_packs,
+            retrieval_qualities,
+        )
 
         logger.info("Contract analysis completed")
         return results
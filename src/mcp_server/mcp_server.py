@@ -188,14 +188,14 @@ def analyze_contract_text(contract_text: str, state: str = "uttar_pradesh") -> D
             state=state
         )
 
-        logger.info(f"Clause agent result : {clause_result}")
+        logger.info("Clause agent result : %s", clause_result)
 
         evidence_pack = system["retrieval"].retrieve(
             clause_result=clause_result,
             state=state
         )
 
-        logger.info(f"retrieval agent result : {evidence_pack}")
+        logger.info("retrieval agent result : %s", evidence_pack)
 
         explanation = system["explainer"].explain(
             clause=chunk,
@@ -203,7 +203,7 @@ def analyze_contract_text(contract_text: str, state: str = "uttar_pradesh") -> D
             evidence_pack=evidence_pack
         )
 
-        logger.info(f"explanation agent result : {explanation}")
+        logger.info("explanation agent result : %s", explanation)
         results.append(explanation)
 
     return {
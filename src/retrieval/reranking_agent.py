@@ -1,3 +1,4 @@
+from operator import itemgetter
 from typing import List
 from sentence_transformers import CrossEncoder
 from vector_index.index_base import IndexDocument
@@ -30,7 +31,7 @@ class CrossEncoderReRankingAgent:
         scored_docs = list(zip(documents, scores))
 
         # Sort descending by relevance score
-        scored_docs.sort(key=lambda x: x[1], reverse=True)
+        scored_docs.sort(key=itemgetter(1), reverse=True)
 
         # Return top_k documents
         return [doc for doc, _ in scored_docs[: self.top_k]]
@@ -356,7 +356,7 @@ class RetrievalOrchestrator:
         # Keep expected statute anchors in the pool even if BM25 is weak
         must_keep = self._expected_anchor_docs(clause_result, docs)
 
-        ranked = sorted(range(len(docs)), key=lambda i: scores[i], reverse=True)
+        ranked = sorted(range(len(docs)), key=scores.__getitem__, reverse=True)
         picked: List[IndexDocument] = []
         picked_ids: set[str] = set()
 
@@ -34,30 +34,22 @@ class SemanticIndexEvaluator:
         coverage = len(evidence_docs) > 0
 
         # ------------------------------------
-        # 2️⃣ Anchor Match
+        # 2️⃣ Anchor Match + 3️⃣ Noise Ratio
         # ------------------------------------
-        anchor_match = False
+        # One pass over the evidence: a doc "matches" if it mentions any
+        # expected section, and the clause is anchored iff any doc matches.
+        sections_lower = [sec.lower() for sec in expected_sections]
+        matching_docs = 0
 
-        if expected_sections and evidence_docs:
+        if sections_lower:
             for doc in evidence_docs:
                 text = doc.get("text", "").lower()
-                for section in expected_sections:
-                    if section.lower() in text:
-                        anchor_match = True
-                        break
-                if anchor_match:
-                    break
-
-        # ------------------------------------
-        # 3️⃣ Noise Ratio
-        # ------------------------------------
-        if evidence_docs:
-            matching_docs = 0
-            for doc in evidence_docs:
-                text = doc.get("text", "").lower()
-                if any(sec.lower() in text for sec in expected_sections):
+                if any(sec in text for sec in sections_lower):
                     matching_docs += 1
 
+        anchor_match = matching_docs > 0
+
+        if evidence_docs:
             noise_ratio = 1 - (matching_docs / len(evidence_docs))
         else:
             noise_ratio = 1.0
@@ -1,5 +1,6 @@
 import json
 import hashlib
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Dict
 
@@ -8,18 +9,25 @@ class LLMResponseCache:
     """
     Deterministic cache for LLM responses.
 
+    Recently used entries are also kept in memory (as their JSON text) so
+    repeated lookups skip the disk read; every get still returns a fresh
+    dict.
+
     Example:
         >>> cache = LLMResponseCache(Path("data/llm_cache"))
         >>> key = cache.build_cache_key("text", "intent", "type", evidence_pack)
         >>> cache.set(key, {"alignment": "aligned"})
     """
 
+    MEMORY_ENTRIES = 2048
+
     def __init__(self, cache_dir: Path):
         """
         Create the cache directory if it does not exist.
         """
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
 
     # -------------------------------------------------
     # Public API
@@ -29,19 +37,29 @@ class LLMResponseCache:
         """
         Load a cached response by key.
         """
+        raw = self._memory.get(cache_key)
+        if raw is not None:
+            self._memory.move_to_end(cache_key)
+            return json.loads(raw)
+
         path = self._path_for_key(cache_key)
         if path.exists():
             with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+                raw = f.read()
+            value = json.loads(raw)
+            self._remember(cache_key, raw)
+            return value
         return None
 
     def set(self, cache_key: str, value: Dict):
         """
         Store a response in the cache.
         """
+        raw = json.dumps(value, indent=2)
         path = self._path_for_key(cache_key)
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(value, f, indent=2)
+            f.write(raw)
+        self._remember(cache_key, raw)
 
     # -------------------------------------------------
     # Helpers
@@ -76,6 +94,15 @@ class LLMResponseCache:
 
         return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
+    def _remember(self, key: str, raw: str) -> None:
+        """
+        Keep raw JSON in memory, evicting the least recently used entry.
+        """
+        self._memory[key] = raw
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.MEMORY_ENTRIES:
+            self._memory.popitem(last=False)
+
     def _path_for_key(self, key: str) -> Path:
         """
         Compute the file path for a cache key.
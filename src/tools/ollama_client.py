@@ -0,0 +1,133 @@
+import json
+import os
+from typing import Iterator
+from urllib.parse import urlsplit
+
+import httpx
+
+
+DEFAULT_PORT = 11434
+
+
+def _ollama_base_url() -> str:
+    """
+    Base URL from OLLAMA_HOST, resolved the way the `ollama` CLI does:
+    unset or empty means 127.0.0.1:11434, and a host without scheme or
+    port (e.g. "0.0.0.0", "localhost") gets port 11434. URLs with an
+    explicit scheme are used as given.
+
+    Example:
+        >>> os.environ["OLLAMA_HOST"] = "localhost"
+        >>> _ollama_base_url()
+        'http://localhost:11434'
+    """
+    host = (os.getenv("OLLAMA_HOST") or "").strip().rstrip("/")
+    if not host:
+        return f"http://127.0.0.1:{DEFAULT_PORT}"
+    if host.startswith(("http://", "https://")):
+        return host
+
+    parts = urlsplit(f"//{host}")
+    try:
+        has_port = parts.port is not None
+    except ValueError:  # non-numeric port; leave it for httpx to report
+        has_port = True
+    if not has_port:
+        host = f"{parts.netloc}:{DEFAULT_PORT}{parts.path}"
+    return f"http://{host}"
+
+
+OLLAMA_BASE_URL = _ollama_base_url()
+GENERATE_URL = f"{OLLAMA_BASE_URL}/api/generate"
+
+# Connect timeout only; generation time is unbounded like `ollama run`.
+CONNECT_TIMEOUT = 10
+
+# One keep-alive client shared by every local-LLM agent, so the Ollama
+# server keeps the model resident and no process is spawned per request.
+CLIENT = httpx.Client(timeout=httpx.Timeout(None, connect=CONNECT_TIMEOUT))
+
+
+class OllamaError(RuntimeError):
+    """
+    Raised when the Ollama server is unreachable or reports an error.
+    """
+
+
+def _response_error(model: str, status_code: int, detail: str) -> OllamaError:
+    """
+    Build the error for a failed response. Unlike `ollama run`, the HTTP
+    API does not pull missing models, so its 404 is reported as such.
+    """
+    if status_code == 404:
+        return OllamaError(
+            f"Ollama model '{model}' is not pulled; run `ollama pull {model}` "
+            f"({detail or 'HTTP 404'})"
+        )
+    return OllamaError(detail or f"HTTP {status_code}")
+
+
+def generate(model: str, prompt: str) -> str:
+    """
+    Run a single non-streaming completion.
+
+    Example:
+        >>> generate("llama3:8b", "Say hi")
+        'Hi!'
+    """
+    try:
+        response = CLIENT.post(
+            GENERATE_URL,
+            json={"model": model, "prompt": prompt, "stream": False},
+        )
+        payload = response.json()
+    except (httpx.HTTPError, ValueError) as e:
+        raise OllamaError(f"Ollama request to {GENERATE_URL} failed: {e}") from e
+
+    if not isinstance(payload, dict):
+        raise OllamaError(
+            f"Unexpected Ollama response (HTTP {response.status_code}): {payload!r}"
+        )
+    if response.status_code != 200 or "error" in payload:
+        raise _response_error(model, response.status_code, payload.get("error"))
+
+    return payload.get("response", "")
+
+
+def stream_generate(model: str, prompt: str) -> Iterator[str]:
+    """
+    Stream a completion as text chunks as Ollama produces tokens.
+
+    Example:
+        >>> "".join(stream_generate("llama3:8b", "Say hi"))
+        'Hi!'
+    """
+    try:
+        with CLIENT.stream(
+            "POST",
+            GENERATE_URL,
+            json={"model": model, "prompt": prompt, "stream": True},
+        ) as response:
+            if response.status_code != 200:
+                response.read()
+                try:
+                    detail = response.json().get("error")
+                except (ValueError, AttributeError):
+                    detail = response.text.strip()
+                raise _response_error(model, response.status_code, detail)
+
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if not isinstance(chunk, dict):
+                    raise OllamaError(f"Unexpected Ollama stream chunk: {chunk!r}")
+                if "error" in chunk:
+                    raise OllamaError(chunk["error"])
+                text = chunk.get("response")
+                if text:
+                    yield text
+                if chunk.get("done"):
+                    break
+    except (httpx.HTTPError, ValueError) as e:
+        raise OllamaError(f"Ollama request to {GENERATE_URL} failed: {e}") from e
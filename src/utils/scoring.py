@@ -0,0 +1,6 @@
+def clip01(x: float) -> float:
+    """
+    Clamp a score to [0, 1] without builtin min/max calls.
+    NaN maps to 1.0, matching max(0.0, min(1.0, x)).
+    """
+    return 0.0 if x <= 0.0 else (x if x < 1.0 else 1.0)
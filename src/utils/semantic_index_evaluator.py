@@ -5,6 +5,7 @@ from utils.statute_normalizer import (
     normalize_section_ref,
     normalize_statutory_basis,
 )
+from utils.scoring import clip01
 
 
 class SemanticIndexEvaluator:
@@ -100,10 +101,8 @@ class SemanticIndexEvaluator:
             noise_penalty = round(max(0.0, 1 - (relevant_hits / total_hits)), 2)
         else:
             # No expected anchor -> doc-type based noise proxy
-            legal_hits = sum(
-                1 for ev in evidences
-                if (getattr(ev, "metadata", None) and ev.metadata.doc_type in self.STATUTORY_DOC_TYPES)
-            )
+            # (statutory evidences were already collected for coverage).
+            legal_hits = len(statutory_evidences)
             noise_penalty = round(max(0.0, 1 - (legal_hits / total_hits)), 2)
 
         chunk_confidence = self._chunk_confidence(clause_result, chunk)
@@ -209,9 +208,9 @@ class SemanticIndexEvaluator:
             0.35 * (1.0 if coverage_ok else 0.0)
             + 0.35 * (1.0 if anchor_match else 0.0)
             + 0.15 * (1.0 - noise_penalty)
-            + 0.15 * max(0.0, min(1.0, chunk_confidence))
+            + 0.15 * clip01(chunk_confidence)
         )
-        return round(max(0.0, min(1.0, score)), 2)
+        return round(clip01(score), 2)
 
     def _reasons(
         self,
@@ -1,7 +1,9 @@
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 
+@lru_cache(maxsize=512)
 def normalize_act_name(act: Optional[str]) -> str:
     """
     Normalize act naming for consistent downstream matching.
@@ -16,6 +18,7 @@ def normalize_act_name(act: Optional[str]) -> str:
     return " ".join(act.split())
 
 
+@lru_cache(maxsize=512)
 def normalize_section_ref(ref: str) -> Optional[str]:
     """
     Normalize section references into a canonical form.
@@ -25,6 +28,9 @@ def normalize_section_ref(ref: str) -> Optional[str]:
     - "section18(1)(a)"
     - "RERA_ACT_SECTION_18_1_A"
     - "18(1)(a)"
+
+    Results are cached: the same handful of references recur across every
+    clause of a contract.
     """
     if not ref:
         return None
@@ -1,8 +1,17 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = PROJECT_ROOT / "src"
 
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_home(tmp_path, monkeypatch):
+    # Keep on-disk caches (e.g. the intent rules sidecar) out of the
+    # user's home directory and the source tree.
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
@@ -0,0 +1,106 @@
+from pathlib import Path
+
+import pytest
+
+from agents.contract_aggregation_agent import ContractAggregationAgent
+from configs.callibration.callibration_config_loader import CalibrationConfig
+from RAG.contract_analysis import ClauseAnalysisResult
+
+
+def _calibration() -> CalibrationConfig:
+    project_root = Path(__file__).resolve().parents[1]
+    return CalibrationConfig(
+        central_path=project_root / "src" / "configs" / "callibration" / "central_config.yaml"
+    )
+
+
+def _clause(clause_id, alignment, role="obligation", quality=0.9, risk="low"):
+    return ClauseAnalysisResult(
+        clause_id=clause_id,
+        clause_role=role,
+        risk_level=risk,
+        alignment=alignment,
+        plain_summary="summary",
+        legal_explanation="explanation",
+        quality_score=quality,
+        compliance_confidence=quality,
+        groundedness_score=0.8,
+    )
+
+
+def test_aggregate_counts_distribution_for_enforceable_clauses():
+    clauses = [
+        _clause("1", "aligned"),
+        _clause("2", "partially_aligned"),
+        _clause("3", "contradiction", quality=0.2, risk="high"),
+        _clause("4", "insufficient_evidence", role="definition"),
+    ]
+
+    result = ContractAggregationAgent(_calibration()).aggregate(clauses)
+    dist = result.contract_summary.distribution
+
+    assert (dist.aligned, dist.partially_aligned) == (1, 1)
+    assert dist.contradiction == 1
+    assert dist.insufficient_evidence == 0
+    assert result.contract_summary.overall_score <= 0.39
+    assert [i.clause_id for i in result.top_issues] == ["3"]
+
+
+def test_conflicting_clauses_are_not_counted_as_contradictions():
+    clauses = [
+        _clause("1", "aligned"),
+        _clause("2", "conflicting"),
+        _clause("3", "conflicting", quality=0.2),
+    ]
+
+    result = ContractAggregationAgent(_calibration()).aggregate(clauses)
+    summary = result.contract_summary
+
+    assert summary.distribution.contradiction == 0
+    assert sum(summary.distribution.model_dump().values()) == 1
+    assert "1 clauses materially affect legal rights" in summary.summary
+    assert summary.overall_score == 0.96
+    assert [i.clause_id for i in result.top_issues] == ["3"]
+    assert result.top_issues[0].issue == (
+        "Clause requires clarification to avoid legal ambiguity"
+    )
+
+
+def test_aggregate_rejects_unknown_alignment():
+    with pytest.raises(ValueError, match="Invalid alignment 'unclear'"):
+        ContractAggregationAgent(_calibration()).aggregate([_clause("1", "unclear")])
+
+
+def test_aggregate_without_enforceable_clauses_uses_neutral_factors():
+    clauses = [_clause("1", "contradiction", role="definition", quality=0.1)]
+
+    result = ContractAggregationAgent(_calibration()).aggregate(clauses)
+    summary = result.contract_summary
+
+    assert summary.overall_score == 0.94
+    assert summary.legal_confidence == 0.82
+    assert summary.risk_level == "low"
+    assert summary.distribution.contradiction == 0
+    assert result.top_issues == []
+
+
+def test_aggregate_many_matches_per_contract_aggregation():
+    agent = ContractAggregationAgent(_calibration())
+    contracts = [
+        [
+            _clause("1", "aligned"),
+            _clause("2", "insufficient_evidence", quality=0.4, risk="high"),
+        ],
+        [_clause("1", "contradiction", role="definition")],
+        [
+            _clause("1", "partially_aligned", quality=0.3),
+            _clause("2", "contradiction", risk="high"),
+            _clause("3", "aligned", role="right"),
+        ],
+    ]
+
+    batched = agent.aggregate_many(contracts)
+
+    assert [r.model_dump() for r in batched] == [
+        agent.aggregate(clauses).model_dump() for clauses in contracts
+    ]
@@ -0,0 +1,80 @@
+import gc
+import weakref
+from pathlib import Path
+
+from agents.intent_rules_engine import IntentRuleEngine, _rules_cache_path
+
+RULES_PATH = (
+    Path(__file__).resolve().parents[1] / "src" / "configs" / "real_state_intent_rules.yaml"
+)
+
+
+def _engine() -> IntentRuleEngine:
+    return IntentRuleEngine(RULES_PATH)
+
+
+def test_classify_many_matches_per_clause_analyze():
+    engine = _engine()
+    items = [
+        ("1", "Delay in possession shall not make the promoter liable."),
+        ("2", "The allottee may withdraw and claim a refund."),
+        ("3", "Nothing relevant here"),
+        ("4", "Delay in possession as per the Act."),
+    ]
+
+    batched = engine.classify_many(items, state="uttar_pradesh")
+
+    assert [r.model_dump() for r in batched] == [
+        engine.analyze(clause_id, text, state="uttar_pradesh").model_dump()
+        for clause_id, text in items
+    ]
+    assert batched[2].intent == "unknown"
+
+
+def test_repeated_clause_text_reuses_classification():
+    engine = _engine()
+    text = "Delay in possession shall not make the promoter liable."
+
+    first = engine.analyze("1", text, state="Uttar_Pradesh")
+    second = engine.analyze("2", text, state="uttar_pradesh")
+
+    assert engine._classify_cached.cache_info().hits == 1
+    assert (first.clause_id, second.clause_id) == ("1", "2")
+    assert first.model_dump(exclude={"clause_id"}) == second.model_dump(exclude={"clause_id"})
+
+    engine.clear_cache()
+    assert engine._classify_cached.cache_info().currsize == 0
+
+
+def test_rules_sidecar_is_written_to_cache_home(tmp_path):
+    cold = _engine()
+    cache_path = _rules_cache_path(RULES_PATH)
+
+    assert cache_path.is_relative_to(tmp_path / "cache")
+    assert cache_path.exists()
+    assert not RULES_PATH.with_suffix(".rules.json").exists()
+    assert _engine().rules == cold.rules
+
+
+def test_unwritable_cache_home_still_loads_rules(tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(blocker))
+
+    engine = _engine()
+
+    assert engine.rules
+    assert not _rules_cache_path(RULES_PATH).exists()
+
+
+def test_engine_is_freed_without_cycle_collection():
+    engine = _engine()
+    engine.analyze("1", "Delay in possession as per the Act.", state="uttar_pradesh")
+    engine_ref = weakref.ref(engine)
+
+    gc.disable()
+    try:
+        del engine
+        assert engine_ref() is None
+    finally:
+        gc.enable()
@@ -0,0 +1,70 @@
+import pytest
+
+from agents.legal_details_drafter_agent import LocalLLMAdapter
+
+
+@pytest.fixture
+def adapter():
+    return LocalLLMAdapter()
+
+
+def test_split_drafts_well_formed(adapter):
+    text = "### DRAFT 1\nFirst draft.\n\n### DRAFT 2\nSecond draft.\n"
+
+    assert adapter._split_drafts(text, 2) == ["First draft.", "Second draft."]
+
+
+def test_split_drafts_titled_and_bold_headers(adapter):
+    text = (
+        "Here are the drafts.\n"
+        "### DRAFT 1: Delay clause\nFirst draft.\n"
+        "**DRAFT 2**\nSecond draft.\n"
+        "### **Draft 3 - Refund**\nThird draft.\n"
+    )
+
+    assert adapter._split_drafts(text, 3) == [
+        "First draft.",
+        "Second draft.",
+        "Third draft.",
+    ]
+
+
+def test_split_drafts_missing_sections_are_empty(adapter):
+    text = "### DRAFT 2\nOnly the second.\n"
+
+    assert adapter._split_drafts(text, 3) == ["", "Only the second.", ""]
+    assert adapter._split_drafts("No headers at all.", 2) == ["", ""]
+
+
+def test_split_drafts_ignores_out_of_range_and_duplicates(adapter):
+    text = (
+        "### DRAFT 0\nZero.\n"
+        "### DRAFT 1\nFirst.\n"
+        "### DRAFT 1\nRepeated.\n"
+        "### DRAFT 3\nOut of range.\n"
+    )
+
+    assert adapter._split_drafts(text, 2) == ["First.", ""]
+
+
+def test_split_drafts_does_not_treat_body_text_as_header(adapter):
+    text = "### DRAFT 1\nDraft 2 of the agreement applies.\n"
+
+    assert adapter._split_drafts(text, 2) == ["Draft 2 of the agreement applies.", ""]
+
+
+def test_generate_drafts_batch_uses_one_call_for_titled_sections(adapter, monkeypatch):
+    prompts = []
+
+    def fake_generate(model, prompt):
+        prompts.append(prompt)
+        return "### DRAFT 1: Delay\nFirst.\n### DRAFT 2: Refund\nSecond.\n"
+
+    monkeypatch.setattr(
+        "agents.legal_details_drafter_agent.generate", fake_generate
+    )
+
+    drafts = adapter.generate_drafts_batch([("c1", "e1"), ("c2", "e2")])
+
+    assert drafts == ["First.", "Second."]
+    assert len(prompts) == 1
@@ -0,0 +1,264 @@
+import pytest
+from pydantic import ValidationError
+
+from agents.legal_explanation_agent import LegalExplanationAgent, _trusted_result
+from RAG.contract_analysis import ClauseAnalysisResult
+from RAG.models import (
+    ChunkMetadata,
+    ClauseUnderstandingResult,
+    Evidence,
+    EvidencePack,
+)
+from RAG.user_contract_chunker import ChunkType, ContractChunk
+
+
+_BASIS = {
+    "act": "RERA Act, 2016",
+    "sections": ["Section 18(1)"],
+    "state_rules": ["UP RERA Rules, Rule 16"],
+}
+
+
+def _chunk(chunk_id, confidence=0.7, semantic_confidence=0.0):
+    return ContractChunk(
+        chunk_id=chunk_id,
+        text="The Promoter shall hand over possession by the agreed date.",
+        chunk_type=ChunkType.CLAUSE,
+        title="Possession",
+        confidence=confidence,
+        semantic_confidence=semantic_confidence,
+    )
+
+
+def _clause_result(
+    clause_id,
+    intent="delay_in_possession",
+    mode="EXPLICIT",
+    compliance=0.9,
+    semantic=0.85,
+    basis=_BASIS,
+):
+    return ClauseUnderstandingResult(
+        clause_id=clause_id,
+        intent=intent,
+        obligation_type="promoter",
+        risk_level="medium",
+        needs_legal_validation=True,
+        compliance_mode=mode,
+        compliance_confidence=compliance,
+        semantic_confidence=semantic,
+        statutory_basis=basis,
+        clause_role="obligation",
+    )
+
+
+def _evidence(doc_type, source, ref):
+    return Evidence(
+        source=source,
+        section_or_clause=ref,
+        text="  The promoter shall be liable   to return the amount received. ",
+        metadata=ChunkMetadata(
+            doc_type=doc_type,
+            jurisdiction="india",
+            source=source,
+            version="2016",
+            section_or_clause=ref,
+        ),
+    )
+
+
+def _pack(clause_id, evidences, coverage=True, anchor_match=True):
+    return EvidencePack(
+        clause_id=clause_id,
+        clause_text="...",
+        risk_level="medium",
+        evidences=evidences,
+        diagnostics={"coverage": coverage, "anchor_match": anchor_match},
+    )
+
+
+def test_explain_batch_matches_per_clause_explain():
+    statutory = [
+        _evidence("rera_act", "RERA Act", "Section 18"),
+        _evidence("model_agreement", "model_bba", "Clause 7"),
+    ]
+    cases = [
+        # Assertive, fully grounded
+        (_chunk("1"), _clause_result("1"), _pack("1", statutory), None),
+        # CONTRADICTION fixes stance and alignment
+        (
+            _chunk("2"),
+            _clause_result("2", mode="CONTRADICTION", compliance=0.95),
+            _pack("2", statutory),
+            {"groundedness_score": 0.4, "coverage_ok": True, "anchor_match": True},
+        ),
+        # Unknown intent, no statutory basis, no evidences
+        (
+            _chunk("3", confidence=0.6),
+            _clause_result("3", intent="unknown", semantic=None, basis=None),
+            _pack("3", []),
+            {},
+        ),
+        # Empty evidences with a cautious score and partial diagnostics
+        (
+            _chunk("4"),
+            _clause_result("4", compliance=0.6, semantic=0.7),
+            _pack("4", [], coverage=True, anchor_match=False),
+            None,
+        ),
+        # Failed grounding checks downgrade alignment
+        (
+            _chunk("5", semantic_confidence=0.55),
+            _clause_result("5", intent="jurisdiction", compliance=None, semantic=None),
+            _pack("5", statutory[1:]),
+            {
+                "groundedness_score": 0.3,
+                "coverage_ok": False,
+                "anchor_match": False,
+                "expected_sections": ["Section 79"],
+                "noise_penalty": 0.8,
+            },
+        ),
+    ]
+    agent = LegalExplanationAgent()
+
+    batched = agent.explain_batch(*map(list, zip(*cases)))
+
+    assert [r.model_dump() for r in batched] == [
+        agent.explain(
+            clause=clause,
+            clause_result=clause_result,
+            evidence_pack=evidence_pack,
+            retrieval_quality=retrieval_quality,
+        ).model_dump()
+        for clause, clause_result, evidence_pack, retrieval_quality in cases
+    ]
+    assert [r.alignment for r in batched] == [
+        "aligned",
+        "contradiction",
+        "insufficient_evidence",
+        "partially_aligned",
+        "insufficient_evidence",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("confidence", "stance"),
+    [
+        (0.49, "WARNING"),
+        (0.5, "CAUTIOUS"),
+        (0.8, "ASSERTIVE"),
+        (float("nan"), "WARNING"),
+        (float("inf"), "WARNING"),
+        (float("-inf"), "WARNING"),
+    ],
+)
+def test_determine_stance_buckets_confidence(confidence, stance):
+    assert LegalExplanationAgent._determine_stance(confidence) == stance
+
+
+def test_explain_batch_gives_warning_stance_for_nan_confidence(monkeypatch):
+    build_payload = LegalExplanationAgent._build_payload
+    stances = []
+
+    def record_stance(self, *item, scores):
+        semantic, _, stance = scores
+        stances.append(stance)
+        # NaN would fail result validation; only the stance is under test.
+        return build_payload(self, *item, scores=(semantic, 0.0, stance))
+
+    monkeypatch.setattr(LegalExplanationAgent, "_build_payload", record_stance)
+    LegalExplanationAgent().explain_batch(
+        [_chunk("1"), _chunk("2")],
+        [
+            _clause_result("1").model_copy(update={"compliance_confidence": float("nan")}),
+            _clause_result("2"),
+        ],
+        [_pack("1", []), _pack("2", [])],
+    )
+
+    assert stances == ["WARNING", "ASSERTIVE"]
+
+
+def test_explain_batch_without_clauses_returns_empty_list():
+    assert LegalExplanationAgent().explain_batch([], [], []) == []
+
+
+def _payload(**overrides):
+    data = {
+        "clause_id": "7",
+        "normalized_reference": "Clause 7",
+        "heading": None,
+        "statutory_refs": ["RERA Act, 2016 - Section 18(1)"],
+        "risk_level": "medium",
+        "alignment": "aligned",
+        "plain_summary": "summary",
+        "legal_explanation": "explanation",
+        "quality_score": 0.85,
+        "compliance_confidence": 0.85,
+        "semantic_confidence": 0.9,
+        "groundedness_score": None,
+        "clause_role": "obligation",
+        "recommended_action": "No action required.",
+        "citations": [{"source": "RERA Act, 2016", "ref": "Section 18(1)"}],
+        "evidence_snippets": [],
+    }
+    data.update(overrides)
+    return data
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {},
+        {"heading": "Possession", "groundedness_score": 0.0, "clause_role": None},
+        {"quality_score": 0.0, "compliance_confidence": 1.0, "citations": []},
+    ],
+)
+def test_trusted_result_matches_model_validate(overrides):
+    expected = ClauseAnalysisResult.model_validate(_payload(**overrides))
+
+    result = _trusted_result(_payload(**overrides))
+
+    assert result.model_dump() == expected.model_dump()
+    assert result.model_fields_set == expected.model_fields_set
+
+
+def test_trusted_result_matches_model_validate_for_agent_payloads():
+    agent = LegalExplanationAgent()
+    payload = agent._build_payload(
+        _chunk("1"),
+        _clause_result("1"),
+        _pack("1", [_evidence("rera_act", "RERA Act", "Section 18")]),
+        {"groundedness_score": 0.75, "coverage_ok": True, "anchor_match": True},
+    )
+    payload.pop("groundedness")
+    expected = ClauseAnalysisResult.model_validate(dict(payload))
+
+    assert _trusted_result(payload).model_dump() == expected.model_dump()
+
+
+def test_trusted_result_falls_back_to_validation_for_coercible_payloads():
+    result = _trusted_result(_payload(quality_score=1))
+
+    # model_validate coerces the int; model_construct would keep it.
+    assert type(result.quality_score) is float
+    assert result.model_dump() == ClauseAnalysisResult.model_validate(
+        _payload(quality_score=1)
+    ).model_dump()
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"compliance_confidence": 1.5},
+        {"semantic_confidence": -0.1},
+        {"clause_id": None},
+        {"citations": [{"source": "RERA Act, 2016", "ref": None}]},
+    ],
+)
+def test_trusted_result_rejects_what_model_validate_rejects(overrides):
+    with pytest.raises(ValidationError):
+        ClauseAnalysisResult.model_validate(_payload(**overrides))
+    with pytest.raises(ValidationError):
+        _trusted_result(_payload(**overrides))
@@ -0,0 +1,77 @@
+import httpx
+import pytest
+
+from tools import ollama_client
+from tools.ollama_client import OllamaError, _ollama_base_url, generate, stream_generate
+
+
+@pytest.mark.parametrize(
+    ("env_value", "expected"),
+    [
+        (None, "http://127.0.0.1:11434"),
+        ("", "http://127.0.0.1:11434"),
+        ("   ", "http://127.0.0.1:11434"),
+        ("0.0.0.0", "http://0.0.0.0:11434"),
+        ("localhost", "http://localhost:11434"),
+        ("localhost/", "http://localhost:11434"),
+        ("127.0.0.1:8080", "http://127.0.0.1:8080"),
+        ("[::1]", "http://[::1]:11434"),
+        ("[::1]:8080", "http://[::1]:8080"),
+        ("http://example.com", "http://example.com"),
+        ("https://example.com:8443/", "https://example.com:8443"),
+    ],
+)
+def test_ollama_base_url(monkeypatch, env_value, expected):
+    if env_value is None:
+        monkeypatch.delenv("OLLAMA_HOST", raising=False)
+    else:
+        monkeypatch.setenv("OLLAMA_HOST", env_value)
+
+    assert _ollama_base_url() == expected
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    def install(status_code, **body):
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(status_code, **body)
+        )
+        monkeypatch.setattr(ollama_client, "CLIENT", httpx.Client(transport=transport))
+
+    return install
+
+
+def test_generate_returns_response_text(serve):
+    serve(200, json={"response": "Hi!", "done": True})
+
+    assert generate("llama3:8b", "Say hi") == "Hi!"
+
+
+def test_generate_rejects_non_object_body(serve):
+    serve(200, json=["not", "an", "object"])
+
+    with pytest.raises(OllamaError, match="Unexpected Ollama response"):
+        generate("llama3:8b", "Say hi")
+
+
+def test_generate_reports_missing_model(serve):
+    serve(404, json={"error": "model 'llama3:8b' not found"})
+
+    with pytest.raises(OllamaError, match="ollama pull llama3:8b"):
+        generate("llama3:8b", "Say hi")
+
+
+def test_stream_generate_reports_missing_model(serve):
+    serve(404, json={"error": "model 'llama3:8b' not found"})
+
+    with pytest.raises(OllamaError, match="ollama pull llama3:8b"):
+        list(stream_generate("llama3:8b", "Say hi"))
+
+
+def test_stream_generate_yields_chunks_until_done(serve):
+    serve(
+        200,
+        content=b'{"response": "Hi"}\n{"response": "!", "done": true}\n{"response": "x"}\n',
+    )
+
+    assert "".join(stream_generate("llama3:8b", "Say hi")) == "Hi!"